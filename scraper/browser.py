@@ -0,0 +1,15 @@
+"""
+Playwright request handling shared by scraper.main and scraper.umn_listings.
+"""
+
+# Requests aborted in every context: photos, video and web fonts are never parsed.
+# Stylesheets still load - innerText and the pagination / "Load More" clicks depend on layout.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+
+async def block_heavy_resources(route):
+    """Route handler that aborts BLOCKED_RESOURCE_TYPES and lets everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
@@ -0,0 +1,173 @@
+"""
+Geocoding pieces shared by scraper.main and scraper.umn_listings.
+
+Both scrapers send requests to the same Nominatim endpoint, at the same polite rate, and
+keep results in one sqlite cache keyed by normalized address, so an address geocoded by
+either scraper is never sent to Nominatim again. Both also measure distance to campus
+with the vectorized haversine defined here.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from math import cos, radians
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import numpy as np
+
+# requests is imported on first use so importing the scrapers for offline work stays cheap
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Geocoding backend. Set NOMINATIM_URL to a self-hosted Nominatim search endpoint to
+# lift the public server's rate limit and geocode with more threads in parallel.
+NOMINATIM_URL = os.environ.get("NOMINATIM_URL", "https://nominatim.openstreetmap.org/search")
+NOMINATIM_SELF_HOSTED = "NOMINATIM_URL" in os.environ
+
+GEOCODE_CACHE_FILE = Path("output") / "geocode_cache.sqlite"
+GEOCODE_MISS_TTL_SECONDS = 7 * 24 * 3600  # re-try addresses Nominatim couldn't find after a week
+
+
+# ============================================================================
+# DISTANCE
+# ============================================================================
+
+EARTH_RADIUS_KM = 6371
+
+
+@dataclass(frozen=True, slots=True)
+class GeoAnchor:
+    """A fixed reference point with its radians and cos(lat) precomputed for haversine."""
+    lat_r: float
+    lon_r: float
+    cos_lat_r: float
+
+    @classmethod
+    def from_degrees(cls, lat: float, lon: float) -> "GeoAnchor":
+        lat_r = radians(lat)
+        return cls(lat_r, radians(lon), cos(lat_r))
+
+
+def haversine_to_batch(anchor: GeoAnchor, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Haversine distance (km) from arrays of points in degrees to an anchor. NaN in, NaN out."""
+    lat_r = np.radians(lats)
+    a = np.sin((anchor.lat_r - lat_r) / 2) ** 2 + np.cos(lat_r) * anchor.cos_lat_r * np.sin((anchor.lon_r - np.radians(lons)) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+
+class RateGate:
+    """Thread-safe gate that spaces successive callers at least `interval` seconds apart."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# ============================================================================
+# HTTP SESSION
+# ============================================================================
+
+# Keep-alive sessions shared by all Nominatim requests, one per User-Agent (created on first geocode)
+_geocode_sessions: Dict[str, "requests.Session"] = {}
+
+
+def get_geocode_session(user_agent: str, pool_maxsize: int) -> "requests.Session":
+    """Return the shared Nominatim session, retrying transient 5xx/connection errors in the adapter.
+
+    `pool_maxsize` should match the number of geocoding threads so none wait for a connection.
+    """
+    session = _geocode_sessions.get(user_agent)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({'User-Agent': user_agent})
+        retry = Retry(total=2, backoff_factor=1, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)  # self-hosted backends are often plain HTTP
+        _geocode_sessions[user_agent] = session
+    return session
+
+
+# ============================================================================
+# PERSISTENT CACHE
+# ============================================================================
+
+# Normalized address -> lat/lon; NULL lat/lon records a confirmed miss
+_geocode_cache: Optional[sqlite3.Connection] = None
+_geocode_cache_lock = threading.Lock()
+
+
+def normalize_address(address: str) -> str:
+    """Cache key for an address: lowercased with whitespace collapsed."""
+    return " ".join(address.lower().split())
+
+
+def get_geocode_cache() -> sqlite3.Connection:
+    global _geocode_cache
+    if _geocode_cache is None:
+        GEOCODE_CACHE_FILE.parent.mkdir(exist_ok=True)
+        conn = sqlite3.connect(GEOCODE_CACHE_FILE, check_same_thread=False, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocode "
+            "(address TEXT PRIMARY KEY, lat REAL, lon REAL, ts INTEGER NOT NULL)"
+        )
+        _geocode_cache = conn
+    return _geocode_cache
+
+
+def geocode_cache_lookup(key: str) -> Tuple[bool, Optional[Dict[str, float]]]:
+    """Return (hit, coords). Misses older than GEOCODE_MISS_TTL_SECONDS don't count as hits."""
+    try:
+        with _geocode_cache_lock:
+            row = get_geocode_cache().execute(
+                "SELECT lat, lon, ts FROM geocode WHERE address = ?", (key,)
+            ).fetchone()
+    except Exception as e:
+        logger.warning(f"Geocode cache lookup failed: {e}")
+        return False, None
+    if row is None:
+        return False, None
+    lat, lon, ts = row
+    if lat is None or lon is None:
+        return time.time() - ts < GEOCODE_MISS_TTL_SECONDS, None
+    return True, {'lat': lat, 'lon': lon}
+
+
+def geocode_cache_store(key: str, coords: Optional[Dict[str, float]]):
+    """Remember a result for `key`; None records a confirmed miss."""
+    try:
+        lat, lon = (coords['lat'], coords['lon']) if coords else (None, None)
+        with _geocode_cache_lock:
+            get_geocode_cache().execute(
+                "INSERT OR REPLACE INTO geocode (address, lat, lon, ts) VALUES (?, ?, ?, ?)",
+                (key, lat, lon, int(time.time())),
+            )
+    except Exception as e:
+        logger.warning(f"Geocode cache write failed: {e}")
@@ -8,24 +8,48 @@ Usage:
 """
 import argparse
 import asyncio
+import atexit
 import csv
+import heapq
 import json
 import logging
+import operator
 import os
 import random
 import re
 import signal
 import sys
 import time
-from dataclasses import dataclass, asdict, field, fields
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from math import radians, cos, sin, asin, sqrt
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Set
+from typing import TYPE_CHECKING, Callable, Iterable, List, NamedTuple, Optional, Dict, Any, Set, FrozenSet, Tuple, Union
 from urllib.parse import urljoin
 
-from playwright.async_api import async_playwright, Page
-import requests
+import numpy as np
+
+try:
+    import fcntl  # POSIX only; used to lock the combined CSV while appending
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson  # optional; faster decoding of Nominatim responses and JSON-LD
+except ImportError:
+    orjson = None
+
+# playwright and requests are imported where they are used so that re-exporting
+# or inspecting existing data does not pay for their (large) import cost
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page
+
+from .browser import block_heavy_resources
+from .geocoding import (
+    NOMINATIM_SELF_HOSTED, NOMINATIM_URL, GeoAnchor, RateGate,
+    geocode_cache_lookup, geocode_cache_store, get_geocode_session, haversine_to_batch, normalize_address,
+)
 
 
 # ============================================================================
@@ -35,6 +59,9 @@ import requests
 UMN_CAMPUS_LAT = 44.9731
 UMN_CAMPUS_LON = -93.2359
 SEARCH_RADIUS_KM = 10.0  # 10 km radius (updated)
+# 3-digit ZIP prefixes of the Twin Cities metro. Every Minnesota ZIP outside these is well
+# beyond SEARCH_RADIUS_KM, so such units are dropped without a geocoding request.
+METRO_ZIP_PREFIXES = frozenset({'550', '551', '553', '554', '555'})
 
 BASE_URL = "https://www.apartments.com"
 SEARCH_LOCATION = "Minneapolis, MN"
@@ -156,14 +183,7 @@ def generate_search_urls() -> List[str]:
     urls.extend(SPECIAL_CATEGORY_SEARCHES)
     
     # Remove duplicates while preserving order
-    seen = set()
-    unique_urls = []
-    for url in urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
-    
-    return unique_urls
+    return list(dict.fromkeys(urls))
 
 # Generate the full search URL list (now ~35 verified working URLs)
 SEARCH_LOCATIONS = generate_search_urls()
@@ -174,7 +194,10 @@ PAGE_DELAY_SECONDS = 5.0  # Base delay (reduced from 6.0 for faster scraping)
 # Turbo mode: faster but higher risk of detection (set by --turbo flag)
 TURBO_PAGE_DELAY = 3.0  # Faster delays for turbo mode
 PAGE_DELAY_VARIANCE = 5.0  # Random variance added to base delay (0 to this value)
-GEOCODE_DELAY_SECONDS = 1.5
+# Geocoding backend: see NOMINATIM_URL in scraper.geocoding
+GEOCODE_DELAY_SECONDS = 0.0 if NOMINATIM_SELF_HOSTED else 1.5  # min spacing between requests, across all threads
+GEOCODE_WORKERS = 16 if NOMINATIM_SELF_HOSTED else 4  # threads used by geocode_addresses
+GEOCODE_USER_AGENT = 'UMN-Housing-Research/1.0 (dillo370@umn.edu)'
 
 # Bot detection avoidance settings
 SCROLL_DELAY_MIN = 0.5  # Minimum delay when scrolling
@@ -182,8 +205,9 @@ SCROLL_DELAY_MAX = 2.0  # Maximum delay when scrolling
 MOUSE_MOVE_ENABLED = True  # Enable simulated mouse movements
 
 # Bot detection retry settings (when "Access Denied" is detected)
-BOT_DETECTION_BASE_WAIT = 30  # Base seconds to wait when bot detected
-BOT_DETECTION_RETRY_INCREMENT = 15  # Additional seconds per retry attempt
+BOT_DETECTION_BASE_WAIT = 30  # Base seconds to wait when bot detected (doubles per retry)
+MAX_RETRY_WAIT = 300  # Cap on any single exponential backoff wait
+HTTP2_RETRY_ATTEMPTS = 3  # Building page loads retried on ERR_HTTP2_PROTOCOL_ERROR
 
 
 def get_random_delay() -> float:
@@ -216,6 +240,38 @@ USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
 ]
 
+# Browser pooling: one Chromium per session with a small pool of contexts that are
+# reused across buildings (each building gets a fresh page in a pooled context)
+CONTEXT_POOL_SIZE = 4
+
+# Buildings scraped at once. Each worker holds one pooled context and keeps its own
+# randomized delay between pages, so the request rate to apartments.com scales with
+# this number - keep it small.
+MAX_CONCURRENT_BUILDINGS = CONTEXT_POOL_SIZE
+
+# Buildings a worker scrapes before its context is replaced with a fresh one
+# (new user agent, and the renderer's accumulated memory is released)
+CONTEXT_ROTATE_EVERY = 20
+
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+]
+
+BROWSER_EXTRA_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+}
+
 # Output
 OUTPUT_DIR = Path("output")
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -229,10 +285,13 @@ PERSISTENT_CSV = OUTPUT_DIR / "umn_housing_combined.csv"
 SCRAPED_URLS_FILE = OUTPUT_DIR / "scraped_urls.txt"
 LOCATION_COUNTER_FILE = OUTPUT_DIR / "location_counts.txt"
 
+# scrape_date stamped on every UnitListing; refreshed once per scraping session
+_CURRENT_SCRAPE_ISO: str = datetime.now().isoformat()
+
 # Previously scraped URLs to skip (from user-reported lost data)
 # These are URLs the user already scraped but lost - skip them to allow fresh re-scraping
 # NOTE: Only include URLs within 10km of UMN campus. Removed: Edina, St. Louis Park (too far)
-KNOWN_SCRAPED_URLS = [
+KNOWN_SCRAPED_URLS: FrozenSet[str] = frozenset({
     "https://www.apartments.com/lumos-apartments-minneapolis-mn/ztq9cyw/",
     "https://www.apartments.com/lakefield-apartments-minneapolis-mn/vms5ejg/",
     "https://www.apartments.com/the-archive-minneapolis-mn/8z05mr1/",
@@ -255,7 +314,7 @@ KNOWN_SCRAPED_URLS = [
     "https://www.apartments.com/avid-minneapolis-mn/zzj68pw/",
     "https://www.apartments.com/welcome-to-equinox-apartments-saint-anthony-mn/0983tk1/",
     "https://www.apartments.com/sora-minneapolis-mn/",
-]
+})
 
 # Student housing keywords
 STUDENT_KEYWORDS = [
@@ -274,6 +333,61 @@ SHARED_BEDROOM_PATTERNS = [
     r"roommate\s+matching", r"\d+\s+beds?\s+per\s+room"
 ]
 
+# Compiled once at import: each list collapses into a single alternation so a
+# listing's text is scanned once per category instead of once per pattern.
+# Keyword scans over long page text are case-sensitive and run on lowercased text:
+# re.IGNORECASE disables the engine's literal fast paths and is several times slower
+# than one str.lower() copy. IGNORECASE is kept only for short raw strings (SIMPLE_PRICE_RE).
+PER_BED_RE = re.compile("|".join(f"(?:{p})" for p in PER_BED_PATTERNS))
+SHARED_BEDROOM_RE = re.compile("|".join(f"(?:{p})" for p in SHARED_BEDROOM_PATTERNS))
+STUDENT_RE = re.compile("|".join(re.escape(k.lower()) for k in STUDENT_KEYWORDS))
+# Block markers in a lowercased page or error message; errors also count captcha challenges
+BLOCKED_RE = re.compile(r'access denied|blocked')
+BOT_DETECT_RE = re.compile(r'access denied|blocked|captcha')
+
+# Patterns used by the parse_* helpers and geocode_address, compiled once at import
+RANGE_PREFIX_RE = re.compile(r'^\s*(\d+)-\d+(\s+)')
+RANGE_ANY_RE = re.compile(r'\b(\d+)-\d+\b')
+PARENS_RE = re.compile(r'\([^)]*\)')
+ZIP_RE = re.compile(r'(\d{5})')
+ZIP_WORD_RE = re.compile(r'\b(\d{5})\b')
+STATE_RE = re.compile(r'\b([A-Z]{2})\b')
+PRICE_NUMBER_RE = re.compile(r'\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+SIMPLE_PRICE_RE = re.compile(r'^\s*\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:/\s*(?:mo|month))?\s*$', re.IGNORECASE)
+RENT_RE = re.compile(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?')
+# Beds, baths and sqft in one scan. Zero-width so every position is tried, exactly as
+# separate searches would; no two alternatives can match at the same position.
+UNIT_SPECS_RE = re.compile(
+    r'(?=(?P<bed>\d+(?:\.\d+)?)\s*(?:bed|br)'
+    r'|(?P<bath>\d+(?:\.\d+)?)\s*(?:bath|ba)'
+    r'|(?P<sqft>\d{1,3}(?:,\d{3})*)\s*(?:sq\.?\s*ft|sqft|sf))'
+)
+
+# Amenity flag -> keywords that indicate it anywhere in the building page text
+AMENITY_KEYWORDS = {
+    'has_in_unit_laundry': ['in-unit laundry', 'washer/dryer in unit', 'in unit washer'],
+    'has_on_site_laundry': ['on-site laundry', 'laundry facilities'],
+    'has_dishwasher': ['dishwasher'],
+    'has_ac': ['air conditioning', 'central air', 'a/c'],
+    'has_heat_included': ['heat included'],
+    'has_water_included': ['water included'],
+    'has_internet_included': ['internet included', 'wifi included'],
+    'is_furnished': ['furnished'],
+    'has_gym': ['fitness center', 'gym'],
+    'has_pool': ['pool'],
+    'has_rooftop_or_clubroom': ['rooftop', 'clubhouse'],
+    'has_parking_available': ['parking'],
+    'has_garage': ['garage'],
+    'pets_allowed': ['pet friendly', 'pets allowed'],
+}
+# All amenity keywords in one pattern so a page is scanned once for every flag. The
+# lookahead makes each position a zero-width match, so overlapping keywords from
+# different flags are all seen (like an Aho-Corasick pass, without the dependency).
+AMENITY_KEYWORD_FLAGS = {k.lower(): name for name, keywords in AMENITY_KEYWORDS.items() for k in keywords}
+AMENITY_SCAN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(AMENITY_KEYWORD_FLAGS, key=len, reverse=True)) + "))"
+)
+
 
 # ============================================================================
 # LOGGING SETUP
@@ -294,7 +408,7 @@ logger = logging.getLogger(__name__)
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UnitListing:
     listing_id: str
     building_name: str
@@ -339,101 +453,202 @@ class UnitListing:
     pets_allowed: Optional[bool] = None
     is_student_branded: Optional[bool] = None
 
-    scrape_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    scrape_date: str = field(default_factory=lambda: _CURRENT_SCRAPE_ISO)
     source_url: str = ""
 
 
+FIELDNAMES = tuple(UnitListing.__dataclass_fields__.keys())
+# Tri-state flags (True / False / unknown): per-bed pricing, amenities, student branding
+BOOL_FIELDS = tuple(f.name for f in fields(UnitListing) if f.type == Optional[bool])
+# C-level row projector: UnitListing -> tuple of values in FIELDNAMES order
+unit_row = operator.attrgetter(*FIELDNAMES)
+
+
+class PriceInfo(NamedTuple):
+    """Result of parse_price_text."""
+    rent_min: Optional[float]
+    rent_max: Optional[float]
+    price_type: str
+    is_per_bed: Optional[bool]
+    is_shared_bedroom: Optional[bool]
+
+
+class AddressParts(NamedTuple):
+    """Result of parse_address; empty strings where a part is missing."""
+    street: str
+    city: str
+    state: str
+    zip: str
+
+
 # ============================================================================
 # PERSISTENCE AND DEDUPLICATION
 # ============================================================================
 
-def load_existing_listings(csv_path: Path, filter_by_distance: bool = True) -> Dict[str, UnitListing]:
-    """Load existing listings from CSV file into a dict keyed by listing_id.
-    
-    Args:
-        csv_path: Path to the CSV file
-        filter_by_distance: If True, exclude listings beyond SEARCH_RADIUS_KM from UMN (default True)
+def _csv_float(value: str) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _csv_int(value: str) -> Optional[int]:
+    try:
+        return int(float(value)) if value else None
+    except ValueError:
+        return None
+
+
+# CSV output: large write buffer (fewer write syscalls) and bare \n line endings
+CSV_WRITE_BUFFER = 1 << 20
+CSV_LINETERMINATOR = '\n'
+
+_TRUE_STRS = frozenset(('True', 'true', '1'))
+_FALSE_STRS = frozenset(('False', 'false', '0'))
+_CSV_BOOL_VALUES = {**dict.fromkeys(_TRUE_STRS, True), **dict.fromkeys(_FALSE_STRS, False)}
+
+
+def _csv_bool(value: str) -> Optional[bool]:
+    return _CSV_BOOL_VALUES.get(value)
+
+
+# Typed schema for reading UnitListing CSVs back in; columns not listed stay strings
+CSV_COLUMN_CONVERTERS = {
+    **dict.fromkeys(['lat', 'lon', 'dist_to_campus_km', 'beds', 'baths', 'rent_min', 'rent_max'], _csv_float),
+    **dict.fromkeys(['sqft', 'year_built', 'num_units', 'stories'], _csv_int),
+    **dict.fromkeys(BOOL_FIELDS, _csv_bool),
+}
+
+
+def read_listing_rows(csv_path: Path) -> List[Dict[str, Any]]:
+    """Parse a UnitListing CSV into typed row dicts (rows without a listing_id are skipped)."""
+    rows = []
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # Resolve each column's converter once from the header instead of
+        # walking the typed field lists for every row
+        converters = [CSV_COLUMN_CONVERTERS.get(name, str) for name in header]
+        columns = list(zip(header, converters))
+        for values in reader:
+            row = {name: convert(value) for (name, convert), value in zip(columns, values)}
+            if row.get('listing_id'):
+                rows.append(row)
+    return rows
+
+
+@dataclass(slots=True)
+class CombinedIndex:
+    """What a session needs from the combined CSV; the rows themselves are not kept.
+
+    Loaded once per process and kept current by save_session_results, so auto-restart
+    sessions never re-read the file.
     """
-    existing = {}
-    excluded_count = 0
+    ids: Set[str]           # every listing_id in the file, for dedupe
+    source_urls: Set[str]   # building pages already in the file
+    in_radius: int          # rows within SEARCH_RADIUS_KM of UMN
+
+
+def load_combined_index(csv_path: Path) -> CombinedIndex:
+    """Read the combined CSV once and keep only listing IDs, building URLs and a radius count."""
+    ids: Set[str] = set()
+    source_urls: Set[str] = set()
+    in_radius = 0
     if csv_path.exists():
         try:
-            with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    listing_id = row.get('listing_id', '')
-                    if listing_id:
-                        # Convert string values back to appropriate types
-                        for key in ['lat', 'lon', 'dist_to_campus_km', 'beds', 'baths', 'rent_min', 'rent_max']:
-                            if key in row and row[key]:
-                                try:
-                                    row[key] = float(row[key])
-                                except (ValueError, TypeError):
-                                    row[key] = None
-                        for key in ['sqft', 'year_built', 'num_units', 'stories']:
-                            if key in row and row[key]:
-                                try:
-                                    row[key] = int(float(row[key]))
-                                except (ValueError, TypeError):
-                                    row[key] = None
-                        for key in ['is_per_bed', 'is_shared_bedroom', 'has_in_unit_laundry', 
-                                    'has_on_site_laundry', 'has_dishwasher', 'has_ac',
-                                    'has_heat_included', 'has_water_included', 'has_internet_included',
-                                    'is_furnished', 'has_gym', 'has_pool', 'has_rooftop_or_clubroom',
-                                    'has_parking_available', 'has_garage', 'pets_allowed', 'is_student_branded']:
-                            if key in row:
-                                if row[key] in ('True', 'true', '1'):
-                                    row[key] = True
-                                elif row[key] in ('False', 'false', '0'):
-                                    row[key] = False
-                                else:
-                                    row[key] = None
-                        
-                        # Filter by distance if requested (enforce 10km radius)
-                        if filter_by_distance:
-                            dist = row.get('dist_to_campus_km')
-                            if dist is not None and dist > SEARCH_RADIUS_KM:
-                                building = row.get('building_name', 'Unknown')
-                                logger.debug(f"Excluding {building}: {dist:.1f}km from UMN (>{SEARCH_RADIUS_KM}km)")
-                                excluded_count += 1
-                                continue
-                        
-                        existing[listing_id] = row
-            if excluded_count > 0:
-                logger.info(f"Excluded {excluded_count} listings beyond {SEARCH_RADIUS_KM}km radius")
-            logger.info(f"Loaded {len(existing)} existing listings from {csv_path}")
+            rows = read_listing_rows(csv_path)
+            if rows:
+                # Distances for the whole file in one vectorized pass; rows without
+                # coordinates fall back to the stored dist_to_campus_km
+                def column(key: str) -> np.ndarray:
+                    # Blank cells stay '' after coercion; treat anything non-float as missing
+                    values = (r.get(key) if isinstance(r.get(key), float) else np.nan for r in rows)
+                    return np.fromiter(values, dtype=float, count=len(rows))
+
+                dists = haversine_to_batch(UMN_CAMPUS_ANCHOR, column('lat'), column('lon'))
+                dists = np.where(np.isnan(dists), column('dist_to_campus_km'), dists)
+                in_radius = int(np.count_nonzero(~(dists > SEARCH_RADIUS_KM)))
+
+            for row in rows:
+                ids.add(row['listing_id'])
+                if row.get('source_url'):
+                    source_urls.add(row['source_url'])
+            logger.info(f"Loaded {len(ids)} existing listing IDs from {csv_path} ({in_radius} within {SEARCH_RADIUS_KM}km)")
         except Exception as e:
             logger.warning(f"Error loading existing listings: {e}")
-    return existing
+    return CombinedIndex(ids, source_urls, in_radius)
 
 
-def load_scraped_urls(filepath: Path) -> Set[str]:
-    """Load set of already-scraped building URLs, including known previously-scraped URLs."""
-    # Start with known previously scraped URLs (from user's lost data)
-    urls = set(KNOWN_SCRAPED_URLS)
-    if filepath.exists():
+async def load_combined_index_async(csv_path: Path) -> CombinedIndex:
+    """Run load_combined_index in a worker thread so it overlaps with browser work on the event loop."""
+    return await asyncio.to_thread(load_combined_index, csv_path)
+
+
+def find_scraped_urls(filepath: Path, candidates: List[str]) -> Set[str]:
+    """Return the subset of `candidates` that were already scraped.
+    
+    Checks KNOWN_SCRAPED_URLS (from user's lost data) and streams the tracking file
+    line by line, so memory stays proportional to the candidate list rather than
+    to the whole scrape history.
+    """
+    pending = set(candidates)
+    found = pending & KNOWN_SCRAPED_URLS
+    pending -= found
+    if pending and filepath.exists():
         try:
             with open(filepath, 'r') as f:
                 for line in f:
-                    if line.strip():
-                        urls.add(line.strip())
-            logger.info(f"Loaded {len(urls)} previously scraped URLs (including {len(KNOWN_SCRAPED_URLS)} from history)")
+                    url = line.strip()
+                    if url in pending:
+                        found.add(url)
+                        pending.discard(url)
+                        if not pending:
+                            break
         except Exception as e:
-            logger.warning(f"Error loading scraped URLs: {e}")
-    else:
-        logger.info(f"Starting with {len(KNOWN_SCRAPED_URLS)} known scraped URLs from history")
-    return urls
+            logger.warning(f"Error reading scraped URLs: {e}")
+    return found
+
+
+# Open append handles for scraped-URL tracking files, kept for the whole process
+# so each URL is a buffered write rather than an open/write/close round-trip
+_scraped_url_files: Dict[Path, Any] = {}
+_scraped_url_unflushed: Dict[Path, int] = {}
+
+# Flush the tracking file every N URLs so a killed process loses at most a few entries
+SCRAPED_URL_FLUSH_EVERY = 16
 
 
 def save_scraped_url(filepath: Path, url: str):
-    """Append a scraped URL to the tracking file."""
+    """Append a scraped URL to the tracking file (buffered; see close_scraped_url_files)."""
     try:
-        with open(filepath, 'a') as f:
-            f.write(url + '\n')
+        fp = _scraped_url_files.get(filepath)
+        if fp is None:
+            fp = open(filepath, 'a', buffering=1 << 16)
+            _scraped_url_files[filepath] = fp
+        fp.write(url + '\n')
+        unflushed = _scraped_url_unflushed.get(filepath, 0) + 1
+        if unflushed >= SCRAPED_URL_FLUSH_EVERY:
+            fp.flush()
+            unflushed = 0
+        _scraped_url_unflushed[filepath] = unflushed
     except Exception as e:
         logger.warning(f"Error saving scraped URL: {e}")
 
 
+def close_scraped_url_files():
+    """Flush and close any open scraped-URL tracking files."""
+    _scraped_url_unflushed.clear()
+    while _scraped_url_files:
+        filepath, fp = _scraped_url_files.popitem()
+        try:
+            fp.close()
+        except Exception as e:
+            logger.warning(f"Error flushing scraped URLs to {filepath}: {e}")
+
+
+atexit.register(close_scraped_url_files)
+
+
 def load_location_counts(filepath: Path) -> Dict[str, int]:
     """Load how many times each location has been scraped."""
     counts = {}
@@ -460,91 +675,194 @@ def save_location_counts(filepath: Path, counts: Dict[str, int]):
         logger.warning(f"Error saving location counts: {e}")
 
 
-def get_balanced_location_order(locations: List[str], counts: Dict[str, int]) -> List[str]:
+def build_location_queue(locations: List[str], counts: Dict[str, int]) -> List[Tuple[int, float, str]]:
     """
-    Get locations ordered by how few times they've been scraped (least-scraped first).
-    This ensures balanced coverage - no location is scraped more than twice before
-    all others have been scraped twice.
+    Build a min-heap of (scrape_count, random_tiebreak, location) entries.
     
-    Also adds randomization within each tier to avoid predictable patterns.
+    Popping yields the least-scraped location first, which keeps coverage balanced -
+    no location is scraped more than twice before all others have been scraped twice.
+    The random tiebreak shuffles locations within each tier to avoid predictable patterns.
+    Push a location back with requeue_location once its session finishes.
     """
-    # Group locations by their scrape count
-    tiers = {}
-    for loc in locations:
-        count = counts.get(loc, 0)
-        if count not in tiers:
-            tiers[count] = []
-        tiers[count].append(loc)
-    
-    # Shuffle each tier for randomization, then sort by count (lowest first)
-    result = []
-    for count in sorted(tiers.keys()):
-        tier_locs = tiers[count]
-        random.shuffle(tier_locs)  # Randomize within tier
-        result.extend(tier_locs)
-    
-    return result
+    queue = [(counts.get(loc, 0), random.random(), loc) for loc in locations]
+    heapq.heapify(queue)
+    return queue
+
 
+def requeue_location(queue: List[Tuple[int, float, str]], location: str, count: int):
+    """Return a location to the queue with its (possibly updated) scrape count."""
+    heapq.heappush(queue, (count, random.random(), location))
 
-def merge_and_dedupe_units(new_units: List[UnitListing], existing: Dict[str, Any]) -> List[UnitListing]:
-    """Merge new units with existing, keeping only unique listing_ids."""
-    merged = dict(existing)  # Start with existing
-    new_count = 0
+
+def merge_and_dedupe_units(new_units: List[UnitListing], seen_ids: Set[str]) -> List[UnitListing]:
+    """Return the units whose listing_id is not in `seen_ids` (first one wins), adding their IDs to it."""
+    added = []
     for unit in new_units:
-        if unit.listing_id not in merged:
-            merged[unit.listing_id] = asdict(unit)
-            new_count += 1
-    logger.info(f"Added {new_count} new unique listings (total: {len(merged)})")
+        if unit.listing_id not in seen_ids:
+            seen_ids.add(unit.listing_id)
+            added.append(unit)
+    logger.info(f"Added {len(added)} new unique listings (total: {len(seen_ids)})")
+    return added
+
+
+def append_combined_csv(new_units: List[UnitListing], filename: Path):
+    """Append newly merged units to the combined CSV instead of rewriting the whole file.
     
-    # Convert back to UnitListing objects
-    result = []
-    for listing_id, data in merged.items():
-        if isinstance(data, dict):
-            # Filter only valid UnitListing fields
-            valid_fields = {f.name for f in fields(UnitListing)}
-            filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+    Everything, including the header check, happens under an exclusive flock where
+    available, so concurrent scraper processes cannot interleave rows or race a schema
+    migration. If the file is missing or its header does not match the current schema
+    it is rewritten once from its own rows plus `new_units` (see export_combined_csv).
+    """
+    while True:
+        with open(filename, 'a+', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
             try:
-                result.append(UnitListing(**filtered_data))
-            except Exception as e:
-                logger.warning(f"Error creating UnitListing from data: {e}")
-        elif isinstance(data, UnitListing):
-            result.append(data)
-    return result
-
-
-def export_combined_csv(units: List[UnitListing], filename: Path):
-    """Export all units to a combined CSV, overwriting previous."""
-    fieldnames = list(UnitListing.__dataclass_fields__.keys())
-    logger.info(f"Saving {len(units)} total listings to {filename}")
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        if units:
-            rows = [asdict(u) for u in units]
-            writer.writerows(rows)
+                # Another process may have swapped in a migrated file while we waited
+                if os.fstat(f.fileno()).st_ino != os.stat(filename).st_ino:
+                    continue
+                f.seek(0)
+                header = next(csv.reader(f), None)
+                if header is None or tuple(header) != FIELDNAMES:
+                    export_combined_csv(new_units, filename)
+                    return
+
+                logger.info(f"Appending {len(new_units)} new listings to {filename}")
+                f.seek(0, os.SEEK_END)
+                csv.writer(f, lineterminator=CSV_LINETERMINATOR).writerows(map(unit_row, new_units))
+                f.flush()
+                return
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def export_combined_csv(new_units: List[UnitListing], filename: Path):
+    """Rewrite the combined CSV in the current schema: its existing rows, then `new_units`.
+    
+    The caller holds the exclusive lock on `filename` (see append_combined_csv). The new
+    file is written beside it and swapped in with os.replace, so readers never see a
+    truncated file.
+    """
+    old_rows = read_listing_rows(filename) if filename.exists() else []
+    logger.info(f"Saving {len(old_rows) + len(new_units)} total listings to {filename}")
+    tmp_path = filename.with_name(f"{filename.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+            writer = csv.writer(f, lineterminator=CSV_LINETERMINATOR)
+            writer.writerow(FIELDNAMES)
+            writer.writerows([row.get(name) for name in FIELDNAMES] for row in old_rows)
+            writer.writerows(map(unit_row, new_units))
+        os.replace(tmp_path, filename)
+    finally:
+        tmp_path.unlink(missing_ok=True)
     logger.info(f"Combined CSV saved: {filename}")
 
 
+def write_units_csv(units: List[UnitListing], filename: Path):
+    """Write units straight from their attributes (no asdict copies), header first."""
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f, lineterminator=CSV_LINETERMINATOR)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(map(unit_row, units))
+
+
 # ============================================================================
 # UTILITIES
 # ============================================================================
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    lon1_r, lat1_r, lon2_r, lat2_r = map(radians, [lon1, lat1, lon2, lat2])
-    dlon = lon2_r - lon1_r
-    dlat = lat2_r - lat1_r
-    a = sin(dlat/2)**2 + cos(lat1_r) * cos(lat2_r) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-    return 6371 * c
+UMN_CAMPUS_ANCHOR = GeoAnchor.from_degrees(UMN_CAMPUS_LAT, UMN_CAMPUS_LON)
+
+
+# Public Nominatim's usage policy allows ~1 request/second in total, however many threads ask
+_nominatim_gate = RateGate(GEOCODE_DELAY_SECONDS)
 
 
 def geocode_address(address: str) -> Optional[Dict[str, float]]:
+    """Geocode an address, answering repeats from the on-disk cache (see query_nominatim)."""
+    key = normalize_address(address)
+    hit, coords = geocode_cache_lookup(key)
+    if hit:
+        logger.info(f"Geocode cache hit: {address}")
+        return coords
+    coords, definitive = query_nominatim(address)
+    # Don't remember misses caused by network/server errors
+    if coords or definitive:
+        geocode_cache_store(key, coords)
+    return coords
+
+
+def geocode_variants(addr: str):
+    """Yield distinct, non-empty query strings to try for an address, most specific first.
+
+    Each rewrite only runs when the address contains the character it targets.
+    """
+    seen = set()
+
+    def fresh(variant: str) -> bool:
+        if not variant or variant in seen:
+            return False
+        seen.add(variant)
+        return True
+
+    # original first
+    variant = addr.strip()
+    if fresh(variant):
+        yield variant
+
+    if '-' in addr:
+        # Replace numeric ranges like "3413-3433" with the first number only (prefer first endpoint)
+        # e.g. "3413-3433 53rd Ave" -> "3413 53rd Ave"
+        variant = RANGE_PREFIX_RE.sub(r'\1\2', addr).strip()
+        if fresh(variant):
+            yield variant
+
+        # Remove any remaining simple ranges anywhere in the string (fallback to just the first number)
+        variant = RANGE_ANY_RE.sub(r'\1', addr).strip()
+        if fresh(variant):
+            yield variant
+
+    street, comma, rest = addr.partition(',')
+    if comma:
+        # try removing anything before the first comma (some pages put building name first)
+        variant = rest.strip()
+        if fresh(variant):
+            yield variant
+
+    if '(' in addr:
+        # try removing parenthetical content
+        variant = PARENS_RE.sub('', addr).strip()
+        if fresh(variant):
+            yield variant
+
+    # try street + zip if zip present
+    zip_match = ZIP_RE.search(addr)
+    if zip_match:
+        variant = f"{street.strip()}, {zip_match.group(1)}"
+        if fresh(variant):
+            yield variant
+
+
+def geocode_addresses(addresses: Iterable[str], workers: int = GEOCODE_WORKERS) -> Dict[str, Optional[Dict[str, float]]]:
+    """Geocode many addresses on a small thread pool; requests still go out at most once per gate interval."""
+    addresses = list(dict.fromkeys(addresses))
+    if not addresses:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(addresses)))) as executor:
+        return dict(zip(addresses, executor.map(geocode_address, addresses)))
+
+
+def query_nominatim(address: str) -> Tuple[Optional[Dict[str, float]], bool]:
     """Geocode an address using Nominatim (OpenStreetMap). Tries polite jsonv2 + email and several cleaned variants.
     For numeric ranges (e.g. "3413-3433 ...") this will prefer the first house-number as the primary fallback.
+
+    Returns (coords, definitive): definitive is False if any variant failed with an error
+    rather than an empty result, so a miss may be worth retrying later.
     """
+    definitive = True
     try:
-        headers = {'User-Agent': 'UMN-Housing-Research/1.0 (dillo370@umn.edu)'}
-        base_url = "https://nominatim.openstreetmap.org/search"
+        session = get_geocode_session(GEOCODE_USER_AGENT, GEOCODE_WORKERS)
+        base_url = NOMINATIM_URL
         base_params = {
             'format': 'jsonv2',
             'limit': 1,
@@ -552,213 +870,391 @@ def geocode_address(address: str) -> Optional[Dict[str, float]]:
             'email': 'dillo370@umn.edu'
         }
 
-        def generate_variants(addr: str):
-            # original first
-            yield addr.strip()
-
-            # Replace numeric ranges like "3413-3433" with the first number only (prefer first endpoint)
-            # e.g. "3413-3433 53rd Ave" -> "3413 53rd Ave"
-            first_only = re.sub(r'^\s*(\d+)-\d+(\s+)', r'\1\2', addr)
-            if first_only != addr:
-                yield first_only.strip()
-
-            # Remove any remaining simple ranges anywhere in the string (fallback to just the first number)
-            no_range = re.sub(r'\b(\d+)-\d+\b', r'\1', addr)
-            if no_range != addr and no_range != first_only:
-                yield no_range.strip()
-
-            # try removing anything before the first comma (some pages put building name first)
-            if ',' in addr:
-                after = addr.split(',', 1)[1].strip()
-                if after:
-                    yield after
-
-            # try removing parenthetical content
-            yield re.sub(r'\([^)]*\)', '', addr).strip()
-
-            # try street + zip if zip present
-            zip_match = re.search(r'(\d{5})', addr)
-            if zip_match:
-                street = addr.split(',')[0].strip()
-                yield f"{street}, {zip_match.group(1)}"
-
-        attempted = set()
-        for variant in generate_variants(address):
-            if not variant:
-                continue
-            if variant in attempted:
-                continue
-            attempted.add(variant)
+        for variant in geocode_variants(address):
             params = dict(base_params)
             params['q'] = variant
 
             logger.info(f"Geocoding: {variant}")
-            time.sleep(GEOCODE_DELAY_SECONDS)  # polite pause
+            _nominatim_gate.wait()  # polite pause
 
-            # try with up to 2 attempts for transient errors
-            for attempt in range(2):
+            # Transient errors are retried by the session's adapter
+            try:
+                response = session.get(base_url, params=params, timeout=15)
+            except Exception as e:
+                logger.warning(f"Geocoding request error for {variant}: {e}")
+                definitive = False
+                continue
+
+            if response.status_code == 200:
                 try:
-                    response = requests.get(base_url, params=params, headers=headers, timeout=15)
+                    data = orjson.loads(response.content) if orjson is not None else response.json()
+                    if data:
+                        lat = float(data[0].get('lat'))
+                        lon = float(data[0].get('lon'))
+                        logger.info(f"Geocoding success for '{variant}': {lat:.6f}, {lon:.6f}")
+                        return {'lat': lat, 'lon': lon}, True
+                    else:
+                        logger.warning(f"Geocoding returned empty result for: {variant}")
                 except Exception as e:
-                    logger.warning(f"Geocoding request error for {variant}: {e}")
-                    if attempt == 0:
-                        time.sleep(1)
-                        continue
-                    break
-
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        if data:
-                            lat = float(data[0].get('lat'))
-                            lon = float(data[0].get('lon'))
-                            logger.info(f"Geocoding success for '{variant}': {lat:.6f}, {lon:.6f}")
-                            return {'lat': lat, 'lon': lon}
-                        else:
-                            logger.warning(f"Geocoding returned empty result for: {variant}")
-                            break
-                    except Exception as e:
-                        logger.warning(f"Error parsing geocode response for {variant}: {e}")
-                        break
-                elif 500 <= response.status_code < 600:
-                    logger.warning(f"Geocoding HTTP {response.status_code} for {variant} (server error), retrying...")
-                    time.sleep(1)
-                    continue
-                else:
-                    logger.warning(f"Geocoding HTTP {response.status_code} for {variant}: {response.text[:200]}")
-                    break
+                    logger.warning(f"Error parsing geocode response for {variant}: {e}")
+                    definitive = False
+            else:
+                logger.warning(f"Geocoding HTTP {response.status_code} for {variant}: {response.text[:200]}")
+                definitive = False
 
         # nothing matched
-        return None
+        return None, definitive
 
     except Exception as e:
         logger.error(f"Geocoding error for {address}: {e}")
-        return None
+        return None, False
 
-def parse_price_text(price_text: str, full_text: str = "") -> Dict[str, Any]:
-    result = {
-        'rent_min': None,
-        'rent_max': None,
-        'price_type': 'unknown',
-        'is_per_bed': None,
-        'is_shared_bedroom': None
-    }
 
-    if not price_text:
-        return result
+def parse_price_text(price_text: str, page_per_bed: bool = False, page_shared_bedroom: bool = False) -> PriceInfo:
+    """Parse a unit's rent text.
 
-    combined_text = f"{price_text} {full_text}".lower()
+    page_per_bed / page_shared_bedroom are the building page's keyword hits, computed once
+    per page by extract_building_info, so unit rows never rescan the page text.
+    """
+    if not price_text:
+        return PriceInfo(None, None, 'unknown', None, None)
 
-    for pattern in PER_BED_PATTERNS:
-        if re.search(pattern, combined_text, re.IGNORECASE):
-            result['is_per_bed'] = True
-            result['price_type'] = 'per_bed'
-            break
+    # Fast path for a bare "$1,250" / "$1,250/mo" when the page flags nothing either
+    if not (page_per_bed or page_shared_bedroom):
+        simple = SIMPLE_PRICE_RE.match(price_text)
+        if simple:
+            rent = float(simple.group(1).replace(',', ''))
+            return PriceInfo(rent, rent, 'per_unit', False, False)
 
-    for pattern in SHARED_BEDROOM_PATTERNS:
-        if re.search(pattern, combined_text, re.IGNORECASE):
-            result['is_shared_bedroom'] = True
-            break
+    price_type = 'unknown'
+    is_per_bed = is_shared_bedroom = None
 
-    numbers = re.findall(r'\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', price_text)
-    numbers = [float(n.replace(',', '')) for n in numbers]
+    text_lower = price_text.lower()
+    per_bed_hit = page_per_bed or PER_BED_RE.search(text_lower) is not None
+    shared_hit = page_shared_bedroom or SHARED_BEDROOM_RE.search(text_lower) is not None
+
+    if per_bed_hit:
+        is_per_bed = True
+        price_type = 'per_bed'
+
+    if shared_hit:
+        is_shared_bedroom = True
+
+    # One pass over the prices: keep the first two plus a running min/max instead of a list
+    count = 0
+    first = second = low = high = None
+    for match in PRICE_NUMBER_RE.finditer(price_text):
+        value = float(match.group(1).replace(',', ''))
+        if count == 0:
+            first = low = high = value
+        else:
+            if count == 1:
+                second = value
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+        count += 1
 
-    if not numbers:
-        return result
+    if not count:
+        return PriceInfo(None, None, price_type, is_per_bed, is_shared_bedroom)
 
-    text_lower = price_text.lower()
     if 'from' in text_lower:
-        result['rent_min'] = numbers[0]
-        result['rent_max'] = numbers[0]
-        if result['price_type'] == 'unknown':
-            result['price_type'] = 'from_price'
-    elif len(numbers) == 2 and ('-' in price_text or '–' in price_text or 'to' in text_lower):
-        result['rent_min'] = numbers[0]
-        result['rent_max'] = numbers[1]
-        if result['price_type'] == 'unknown':
-            result['price_type'] = 'range'
-    elif len(numbers) == 1:
-        result['rent_min'] = numbers[0]
-        result['rent_max'] = numbers[0]
-        if result['price_type'] == 'unknown':
-            result['price_type'] = 'per_unit'
+        rent_min, rent_max = first, first
+        if price_type == 'unknown':
+            price_type = 'from_price'
+    elif count == 2 and ('-' in price_text or '–' in price_text or 'to' in text_lower):
+        rent_min, rent_max = first, second
+        if price_type == 'unknown':
+            price_type = 'range'
+    elif count == 1:
+        rent_min, rent_max = first, first
+        if price_type == 'unknown':
+            price_type = 'per_unit'
     else:
-        result['rent_min'] = min(numbers)
-        result['rent_max'] = max(numbers)
-        if result['price_type'] == 'unknown':
-            result['price_type'] = 'range'
-
-    if result['is_per_bed'] is None:
-        result['is_per_bed'] = False
-    if result['is_shared_bedroom'] is None:
-        result['is_shared_bedroom'] = False
+        rent_min, rent_max = low, high
+        if price_type == 'unknown':
+            price_type = 'range'
 
-    return result
+    return PriceInfo(rent_min, rent_max, price_type, bool(is_per_bed), bool(is_shared_bedroom))
 
 
-def parse_bedroom_count(text: str) -> Optional[float]:
+def parse_unit_specs(text: str) -> Dict[str, Any]:
+    """Parse beds, baths and sqft from one unit's text in a single pass (None where absent)."""
+    specs = {'beds': None, 'baths': None, 'sqft': None}
     if not text:
-        return None
-    text = text.lower().strip()
+        return specs
+    text = text.lower()
     if 'studio' in text:
-        return 0.0
-    match = re.search(r'(\d+(?:\.\d+)?)\s*(?:bed|br)', text)
-    if match:
-        return float(match.group(1))
-    return None
-
-
-def parse_bathroom_count(text: str) -> Optional[float]:
-    if not text:
-        return None
-    match = re.search(r'(\d+(?:\.\d+)?)\s*(?:bath|ba)', text.lower())
-    return float(match.group(1)) if match else None
-
-
-def parse_sqft(text: str) -> Optional[int]:
-    if not text:
-        return None
-    match = re.search(r'(\d{1,3}(?:,\d{3})*)\s*(?:sq\.?\s*ft|sqft|sf)', text, re.IGNORECASE)
-    return int(match.group(1).replace(',', '')) if match else None
+        specs['beds'] = 0.0
+    for match in UNIT_SPECS_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'bed':
+            if specs['beds'] is None:
+                specs['beds'] = float(match.group('bed'))
+        elif kind == 'bath':
+            if specs['baths'] is None:
+                specs['baths'] = float(match.group('bath'))
+        elif specs['sqft'] is None:
+            specs['sqft'] = int(match.group('sqft').replace(',', ''))
+        if specs['beds'] is not None and specs['baths'] is not None and specs['sqft'] is not None:
+            break
+    return specs
 
 
-def check_amenity(amenity_text: str, keywords: List[str]) -> bool:
-    amm = amenity_text.lower() if amenity_text else ""
-    return any(keyword.lower() in amm for keyword in keywords)
+def find_amenities(text: str) -> Set[str]:
+    """Return the names of the AMENITY_KEYWORDS flags whose keywords appear in `text`."""
+    found: Set[str] = set()
+    for match in AMENITY_SCAN_RE.finditer(text.lower()):
+        found.add(AMENITY_KEYWORD_FLAGS[match.group(1)])
+        if len(found) == len(AMENITY_KEYWORDS):
+            break
+    return found
 
 
 def is_student_housing(building_text: str) -> bool:
-    text_lower = building_text.lower() if building_text else ""
-    return any(keyword in text_lower for keyword in STUDENT_KEYWORDS)
+    return bool(building_text) and STUDENT_RE.search(building_text.lower()) is not None
 
 
-def parse_address(address_text: str) -> Dict[str, str]:
-    parts = {'street': '', 'city': '', 'state': '', 'zip': ''}
+def parse_address(address_text: str) -> AddressParts:
+    street = city = state = zip_code = ''
     try:
         address_text = address_text.strip()
-        zip_match = re.search(r'\b(\d{5})\b', address_text)
+        zip_match = ZIP_WORD_RE.search(address_text)
         if zip_match:
-            parts['zip'] = zip_match.group(1)
-
-        segments = [s.strip() for s in address_text.split(',')]
-        if len(segments) >= 1:
-            parts['street'] = segments[0]
-        if len(segments) >= 2:
-            parts['city'] = segments[1]
-        if len(segments) >= 3:
-            state_match = re.search(r'\b([A-Z]{2})\b', segments[2])
-            if state_match:
-                parts['state'] = state_match.group(1)
+            zip_code = zip_match.group(1)
+
+        # "street, city, ST zip[, ...]" - partition instead of building a list of segments
+        street, sep, rest = address_text.partition(',')
+        street = street.strip()
+        if sep:
+            city, sep, rest = rest.partition(',')
+            city = city.strip()
+            if sep:
+                state_match = STATE_RE.search(rest.partition(',')[0])
+                if state_match:
+                    state = state_match.group(1)
     except Exception as e:
         logger.error(f"Error parsing address: {e}")
-    return parts
+    return AddressParts(street, city, state, zip_code)
 
 
 # ============================================================================
 # SCRAPING FUNCTIONS
 # ============================================================================
 
-async def search_apartments(page: Page, location: str, max_pages: int = 10, start_page: int = 1) -> List[str]:
+async def new_browser_context(browser: "Browser") -> "BrowserContext":
+    """Create a browser context with a randomly chosen user agent and realistic headers."""
+    # Select a random user agent to help avoid detection
+    selected_user_agent = random.choice(USER_AGENTS)
+    logger.info(f"Using user agent: {selected_user_agent[:50]}...")
+    context = await browser.new_context(
+        user_agent=selected_user_agent,
+        viewport={'width': 1920, 'height': 1080},
+        locale='en-US',
+        timezone_id='America/Chicago',
+        extra_http_headers=BROWSER_EXTRA_HEADERS,
+    )
+    await context.route("**/*", block_heavy_resources)
+    return context
+
+
+async def open_context_pool(browser: "Browser", size: int = CONTEXT_POOL_SIZE) -> "asyncio.Queue[BrowserContext]":
+    """Create `size` contexts up front and return them as a queue of idle contexts."""
+    pool: asyncio.Queue = asyncio.Queue()
+    for _ in range(max(1, size)):
+        pool.put_nowait(await new_browser_context(browser))
+    return pool
+
+
+async def close_context_pool(pool: "asyncio.Queue[BrowserContext]"):
+    """Close every idle context in the pool (the browser itself stays open)."""
+    while not pool.empty():
+        context = pool.get_nowait()
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+
+@asynccontextmanager
+async def session_browser(headless: bool, browser: Optional["Browser"] = None):
+    """
+    Yield the browser for one scraping session.
+
+    A browser passed in (kept warm across auto-restart sessions) is yielded as-is and
+    left open; otherwise one is launched for this session and closed afterwards.
+    """
+    if browser is not None:
+        yield browser
+        return
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        launched = await p.chromium.launch(headless=headless, args=BROWSER_LAUNCH_ARGS)
+        try:
+            yield launched
+        finally:
+            await launched.close()
+
+
+@asynccontextmanager
+async def pooled_page(pool: "asyncio.Queue[BrowserContext]"):
+    """Borrow an idle context from the pool, yield a fresh page in it, then return the context."""
+    context = await pool.get()
+    page = await context.new_page()
+    try:
+        yield page
+    finally:
+        try:
+            await page.close()
+        finally:
+            pool.put_nowait(context)
+
+
+class TokenBucket:
+    """
+    Async token bucket that paces page navigations across every worker in a session.
+
+    Holds up to `capacity` tokens and gains one every `interval` seconds; each
+    acquire() takes a token (waiting if none is left) and then sleeps a random
+    0..`jitter` seconds so requests don't land on a fixed beat.
+    """
+
+    def __init__(self, capacity: int, interval: float, jitter: float = 0.0):
+        self.capacity = max(1, capacity)
+        self.interval = interval
+        self.jitter = jitter
+        self._tokens = 1.0  # start nearly empty so a new session doesn't open with a burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.interval > 0:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.interval)
+        else:
+            self._tokens = self.capacity
+        self._updated = now
+
+    async def acquire(self):
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.interval)
+                self._refill()
+            self._tokens -= 1
+        if self.jitter > 0:
+            await asyncio.sleep(random.uniform(0, self.jitter))
+
+
+def new_navigation_limiter() -> TokenBucket:
+    """Session-wide navigation pacing (reads PAGE_DELAY_SECONDS at call time so --turbo applies)."""
+    return TokenBucket(MAX_CONCURRENT_BUILDINGS, PAGE_DELAY_SECONDS, PAGE_DELAY_VARIANCE)
+
+
+async def wait_for_navigation_slot(limiter: Optional[TokenBucket]):
+    """Pace a navigation through the session limiter, or with a plain random delay without one."""
+    if limiter is not None:
+        await limiter.acquire()
+    else:
+        await asyncio.sleep(get_random_delay())
+
+
+def backoff_wait(base: float, attempt: int) -> float:
+    """Exponential backoff: base * 2**attempt seconds, capped at MAX_RETRY_WAIT."""
+    return min(base * 2 ** attempt, MAX_RETRY_WAIT)
+
+
+async def rotate_context(context: "BrowserContext", page: Optional["Page"]) -> Tuple["BrowserContext", Optional["Page"]]:
+    """
+    Replace a long-used context with a fresh one from the same browser.
+
+    Drops the renderer state a tab accumulates over many pages and picks a new user
+    agent. The old context is kept if a new one can't be created.
+    """
+    browser = context.browser
+    if browser is None:
+        return context, page
+    try:
+        fresh = await new_browser_context(browser)
+    except Exception as e:
+        logger.warning(f"Could not rotate browser context: {e}")
+        return context, page
+    try:
+        await context.close()  # also closes its page
+    except Exception as e:
+        logger.warning(f"Error closing browser context: {e}")
+    return fresh, None
+
+
+async def scrape_buildings_concurrently(
+        pool: "asyncio.Queue[BrowserContext]", urls: List[str],
+        handle_result: Callable[[int, str, Union[List[UnitListing], Exception]], bool],
+        workers: int = MAX_CONCURRENT_BUILDINGS, limiter: Optional[TokenBucket] = None) -> None:
+    """
+    Scrape building URLs with up to `workers` pages in flight.
+
+    Each worker borrows one context from the pool and keeps a single page for its
+    buildings (a new page is opened only if the old one gets closed or crashes); every
+    CONTEXT_ROTATE_EVERY buildings the context is swapped for a fresh one.
+    Navigations are paced by `limiter`, which is shared by all workers.
+    `handle_result(idx, url, outcome)` is called as each building finishes, with
+    either the scraped units or the exception raised. Returning False stops the
+    remaining work (in-flight buildings are allowed to finish).
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(urls, 1):
+        queue.put_nowait(item)
+    stop = asyncio.Event()
+
+    async def worker():
+        context = await pool.get()
+        page = None
+        served = 0
+        try:
+            while not stop.is_set():
+                try:
+                    idx, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                logger.info(f"Processing building {idx}/{len(urls)}")
+                try:
+                    if page is None or page.is_closed():
+                        page = await context.new_page()
+                    outcome = await scrape_building(page, url, limiter)
+                except Exception as e:
+                    outcome = e
+                if handle_result(idx, url, outcome) is False:
+                    stop.set()
+                    return
+                served += 1
+                if served % CONTEXT_ROTATE_EVERY == 0 and not queue.empty():
+                    context, page = await rotate_context(context, page)
+        finally:
+            try:
+                if page is not None and not page.is_closed():
+                    await page.close()
+            finally:
+                pool.put_nowait(context)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(workers, len(urls))))))
+
+
+# A building detail page on our own domain (SECURITY: rejects links redirecting elsewhere).
+# Search/filter pages (/search/, bbox=) are excluded, and the first path segment must be a
+# building slug: at least 6 chars, contains a hyphen, and not a city page ending in "-mn".
+BUILDING_URL_RE = re.compile(
+    r'(?!.*(?:/search/|bbox=))https://www\.apartments\.com/+(?=[^/]{6})[^/]*-[^/]*(?<!-mn)(?:/|$)'
+)
+
+# Raw href attributes of every matched link, so one round-trip covers a whole results page
+HREFS_JS = "els => els.map(e => e.getAttribute('href'))"
+
+
+async def search_apartments(page: "Page", location: str, max_pages: int = 10, start_page: int = 1,
+                           limiter: Optional[TokenBucket] = None,
+                           scraped_urls_file: Optional[Path] = None) -> List[str]:
     """
     Search for apartments at a location.
     
@@ -767,6 +1263,9 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
         location: Search location string (can be a neighborhood slug, ZIP code, or filter URL path)
         max_pages: Maximum number of search result pages to scrape
         start_page: Page number to start from (1 = first page, 2 = skip to page 2, etc.)
+        limiter: Session navigation limiter (a plain random delay is used without one)
+        scraped_urls_file: If given, buildings already listed in this tracking file are
+            dropped once the search finishes (one find_scraped_urls pass for all pages)
     
     Returns:
         List of building URLs found
@@ -774,7 +1273,8 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
     logger.info(f"Starting search for: {location}")
     if start_page > 1:
         logger.info(f"Skipping to page {start_page} (to find different buildings)")
-    building_urls = set()
+    # Insertion-ordered set: buildings are queued in the order the search listed them
+    building_urls: Dict[str, None] = {}
     try:
         # Build search URL - location is already formatted as a URL path segment
         # Examples: "dinkytown-minneapolis-mn", "55414/min-1000-max-1500/"
@@ -795,8 +1295,8 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
 
         for attempt in range(5):  # Increased retries
             try:
+                await wait_for_navigation_slot(limiter)
                 response = await page.goto(search_url, wait_until="domcontentloaded", timeout=60000)
-                await asyncio.sleep(get_random_delay())
                 
                 # Check for redirect or access denied
                 final_url = page.url
@@ -806,7 +1306,7 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
                 
                 # Check page content for block messages
                 body_text = await page.locator('body').inner_text()
-                if 'access denied' in body_text.lower() or 'blocked' in body_text.lower():
+                if BLOCKED_RE.search(body_text.lower()):
                     logger.warning("Block message detected in page content!")
                     raise Exception("Access denied - bot detection in page content")
                 
@@ -821,17 +1321,16 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
                 logger.warning(f"Attempt {attempt + 1} failed: {e}")
                 
                 # For HTTP2 errors, wait longer before retry
-                if 'ERR_HTTP2' in error_str or 'PROTOCOL_ERROR' in error_str:
-                    wait_time = 10 + (attempt * 5)  # 10, 15, 20, 25, 30 seconds
+                if is_http2_error(e):
+                    wait_time = backoff_wait(10, attempt)  # 10, 20, 40, 80, 160 seconds
                     logger.info(f"HTTP/2 error detected. Waiting {wait_time}s before retry...")
                     await asyncio.sleep(wait_time)
-                elif 'access denied' in error_str.lower() or 'blocked' in error_str.lower():
-                    # Use defined constants for bot detection wait times
-                    wait_time = BOT_DETECTION_BASE_WAIT + (attempt * BOT_DETECTION_RETRY_INCREMENT)
+                elif BLOCKED_RE.search(error_str.lower()):
+                    wait_time = backoff_wait(BOT_DETECTION_BASE_WAIT, attempt)
                     logger.warning(f"Bot detection! Waiting {wait_time}s before retry...")
                     await asyncio.sleep(wait_time)
                 elif attempt < 4:
-                    await asyncio.sleep(5 + attempt * 2 + random.uniform(0, 3))
+                    await asyncio.sleep(backoff_wait(5, attempt) + random.uniform(0, 3))
                 else:
                     logger.error("Max retries reached. Try running with --headless=False to debug.")
                     logger.error("If issue persists, check your network connection or try later.")
@@ -843,63 +1342,38 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
             # Human-like behavior: random scroll before extracting
             await simulate_human_scrolling(page)
             
-            # Try multiple selectors to find property links
-            property_links = await page.locator('article.placard a.property-link, a.property-link').all()
-            if not property_links:
+            # Try multiple selectors to find property links (hrefs are read in one call per selector)
+            hrefs = await page.eval_on_selector_all('article.placard a.property-link, a.property-link', HREFS_JS)
+            if not hrefs:
                 # Try alternative selectors
-                property_links = await page.locator('.property-title a, a[data-listingid]').all()
-            if not property_links:
+                hrefs = await page.eval_on_selector_all('.property-title a, a[data-listingid]', HREFS_JS)
+            if not hrefs:
                 logger.warning("No property links found with standard selectors")
                 # Try even broader selector as last resort
-                property_links = await page.locator('a[href*="apartments.com/"]').all()
+                hrefs = await page.eval_on_selector_all('a[href*="apartments.com/"]', HREFS_JS)
 
-            for link in property_links:
+            page_urls = []
+            for href in dict.fromkeys(hrefs):
                 try:
-                    href = await link.get_attribute('href')
                     if not href:
                         continue
                     
                     # Resolve relative URLs to absolute using the base URL
-                    full_url = urljoin(BASE_URL, href)
-                    full_url = full_url.split('?')[0]  # Remove query params
-                    
-                    # SECURITY: Validate the URL starts with our expected domain
-                    # This prevents following malicious redirects to other domains
-                    if not full_url.startswith('https://www.apartments.com/'):
-                        continue
-                        
-                    # Filter out search/filter pages (not building detail pages)
-                    excluded_patterns = ['/search/', 'bbox=']
-                    if any(x in full_url for x in excluded_patterns):
-                        continue
-                    
-                    # Make sure it looks like a building URL (has a building slug)
-                    # Building slugs are typically like "the-laker-minneapolis-mn/abc123"
-                    # which is always more than 5 characters and contains hyphens
-                    path = full_url.replace('https://www.apartments.com/', '').strip('/')
-                    parts = path.split('/')
-                    if len(parts) >= 1:
-                        slug = parts[0]
-                        # Valid building slug: at least 6 chars, contains hyphen, 
-                        # not a pure filter like "1-bedrooms" or a city like "minneapolis-mn"
-                        is_valid_building = (
-                            len(slug) > 5 and 
-                            '-' in slug and 
-                            not slug.endswith('-mn')  # City pages end with -mn
-                        )
-                        if is_valid_building:
-                            building_urls.add(full_url)
+                    full_url = urljoin(BASE_URL, href).partition('?')[0]  # Remove query params
+                    if BUILDING_URL_RE.match(full_url) and full_url not in building_urls:
+                        page_urls.append(full_url)
                 except Exception as e:
                     logger.warning(f"Error extracting link: {e}")
 
+            building_urls.update(dict.fromkeys(page_urls))
             logger.info(f"Found {len(building_urls)} unique buildings so far")
 
             next_button = page.locator('a.next, a[rel="next"]')
             if await next_button.count() > 0:
                 try:
+                    await wait_for_navigation_slot(limiter)
                     await next_button.first.click()
                     await page.wait_for_load_state("domcontentloaded", timeout=30000)
-                    await asyncio.sleep(get_random_delay())
                     
                     # Human-like scroll after page load
                     await simulate_human_scrolling(page)
@@ -913,11 +1387,19 @@ async def search_apartments(page: Page, location: str, max_pages: int = 10, star
     except Exception as e:
         logger.error(f"Error during search: {e}")
 
+    if scraped_urls_file is not None and building_urls:
+        # Drop buildings scraped in earlier sessions; the tracking file is read once per search
+        scraped = find_scraped_urls(scraped_urls_file, list(building_urls))
+        for url in scraped:
+            del building_urls[url]
+        if scraped:
+            logger.info(f"Skipped {len(scraped)} buildings already scraped")
+
     logger.info(f"Search complete. Found {len(building_urls)} total buildings")
     return list(building_urls)
 
 
-async def simulate_human_scrolling(page: Page):
+async def simulate_human_scrolling(page: "Page"):
     """Simulate human-like scrolling to avoid bot detection."""
     try:
         # Random scroll pattern
@@ -936,11 +1418,36 @@ async def simulate_human_scrolling(page: Page):
         logger.debug(f"Scroll simulation error (non-fatal): {e}")
 
 
-async def scrape_building(page: Page, url: str) -> List[UnitListing]:
+def is_http2_error(error: Exception) -> bool:
+    error_str = str(error)
+    return 'ERR_HTTP2' in error_str or 'PROTOCOL_ERROR' in error_str
+
+
+async def goto_with_http2_retry(page: "Page", url: str, limiter: Optional[TokenBucket] = None,
+                                attempts: int = HTTP2_RETRY_ATTEMPTS):
+    """
+    Navigate to url, retrying only on a transient ERR_HTTP2_PROTOCOL_ERROR.
+
+    HTTP/2 stays enabled (one multiplexed connection per origin for all of a page's
+    subresources); the occasional protocol reset is retried with exponential backoff
+    instead of forcing every page onto HTTP/1.1. Other errors propagate immediately.
+    """
+    for attempt in range(attempts):
+        await wait_for_navigation_slot(limiter)
+        try:
+            return await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        except Exception as e:
+            if not is_http2_error(e) or attempt == attempts - 1:
+                raise
+            wait_time = backoff_wait(10, attempt)
+            logger.info(f"HTTP/2 error loading {url}. Waiting {wait_time}s before retry...")
+            await asyncio.sleep(wait_time)
+
+
+async def scrape_building(page: "Page", url: str, limiter: Optional[TokenBucket] = None) -> List[UnitListing]:
     logger.info(f"Scraping building: {url}")
     try:
-        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        await asyncio.sleep(get_random_delay())
+        await goto_with_http2_retry(page, url, limiter)
         building_data = await extract_building_info(page, url)
         all_units = await extract_units(page, building_data)
         sampled_units = sample_units(all_units)
@@ -951,7 +1458,80 @@ async def scrape_building(page: Page, url: str) -> List[UnitListing]:
         return []
 
 
-async def extract_building_info(page: Page, url: str) -> Dict[str, Any]:
+# Reads everything extract_building_info needs from the DOM in one page.evaluate
+# round-trip instead of a locator call per selector.
+BUILDING_INFO_JS = """
+() => {
+    const firstText = (selectors) => selectors.map(sel => {
+        const el = document.querySelector(sel);
+        return el ? (el.innerText || '').trim() : null;
+    });
+    const meta = (prop) => {
+        const el = document.querySelector(`meta[property="${prop}"]`);
+        return el ? el.getAttribute('content') : null;
+    };
+    const map = document.querySelector('#map, [id*="map"]');
+    return {
+        names: firstText(['h1.propertyName', 'h1.property-title', 'h1']),
+        addresses: firstText(['.propertyAddress', '.property-address', '[itemprop="address"]',
+                              '[class*="address"]', 'address', '.propertyAddressContainer']),
+        meta_street: meta('og:street-address'),
+        meta_city: meta('og:locality'),
+        meta_state: meta('og:region'),
+        meta_zip: meta('og:postal-code'),
+        json_ld: Array.from(document.querySelectorAll('script[type="application/ld+json"]'),
+                            s => s.textContent),
+        map_lat: map ? map.getAttribute('data-latitude') : null,
+        map_lon: map ? map.getAttribute('data-longitude') : null,
+        body: document.body ? document.body.innerText : ''
+    };
+}
+"""
+
+
+def parse_json_ld(json_texts: List[str], need_address: bool) -> Tuple[Optional[str], Optional[float], Optional[float]]:
+    """
+    Pull a street address and coordinates out of a page's JSON-LD blocks.
+
+    Blocks are read in order until one yields an address (only when `need_address`)
+    or coordinates. Returns (address, lat, lon) with None for anything not found.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    address: Optional[str] = None
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    for json_text in json_texts:
+        try:
+            data = loads(json_text)
+        except Exception:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            addr = item.get('address') or item.get('contactPoint') or {}
+            if isinstance(addr, dict):
+                street = addr.get('streetAddress') or addr.get('street') or ''
+                city = addr.get('addressLocality') or addr.get('city') or ''
+                state = addr.get('addressRegion') or addr.get('state') or ''
+                zipcode = addr.get('postalCode') or ''
+                if street and city and need_address and address is None:
+                    address = f"{street}, {city}, {state} {zipcode}".strip()
+            geo = item.get('geo') or item.get('location') or item.get('hasMap') or {}
+            if isinstance(geo, dict):
+                geo_lat = geo.get('latitude') or geo.get('lat') or geo.get('lng') or geo.get('lon')
+                geo_lon = geo.get('longitude') or geo.get('lon') or geo.get('lng')
+                if geo_lat and geo_lon:
+                    try:
+                        lat, lon = float(geo_lat), float(geo_lon)
+                    except (TypeError, ValueError):
+                        pass
+        if address is not None or not need_address or lat is not None:
+            break
+    return address, lat, lon
+
+
+async def extract_building_info(page: "Page", url: str) -> Dict[str, Any]:
     building_data = {
         'source_url': url,
         'building_name': '',
@@ -968,19 +1548,18 @@ async def extract_building_info(page: Page, url: str) -> Dict[str, Any]:
         'stories': None,
         'amenities': {},
         'is_student_branded': False,
-        'full_page_text': ''
+        'page_per_bed': False,
+        'page_shared_bedroom': False,
     }
     try:
+        dom = await page.evaluate(BUILDING_INFO_JS)
+
         # Name
-        name_selectors = ['h1.propertyName', 'h1.property-title', 'h1']
-        for selector in name_selectors:
-            name_elem = page.locator(selector).first
-            if await name_elem.count() > 0:
-                nm = (await name_elem.inner_text()).strip()
-                if nm:
-                    building_data['building_name'] = nm
-                    logger.info(f"Building name: {nm}")
-                    break
+        for nm in dom['names']:
+            if nm:
+                building_data['building_name'] = nm
+                logger.info(f"Building name: {nm}")
+                break
 
         # city/state from URL slug
         url_parts = url.lower().replace('https://www.apartments.com/', '').split('/')
@@ -998,23 +1577,16 @@ async def extract_building_info(page: Page, url: str) -> Dict[str, Any]:
         address_found = False
         street_only = ""
 
-        address_selectors = [
-            '.propertyAddress', '.property-address', '[itemprop="address"]',
-            '[class*="address"]', 'address', '.propertyAddressContainer'
-        ]
-        for selector in address_selectors:
-            addr_elem = page.locator(selector).first
-            if await addr_elem.count() > 0:
-                addr = (await addr_elem.inner_text()).strip()
-                if addr and len(addr) > 5:
-                    if any(city in addr.lower() for city in ['minneapolis', 'st paul', 'brooklyn']):
-                        building_data['full_address'] = addr
-                        logger.info(f"Found COMPLETE address: {addr}")
-                        address_found = True
-                        break
-                    else:
-                        street_only = addr.rstrip(',').strip()
-                        logger.info(f"Found street address: {street_only}")
+        for addr in dom['addresses']:
+            if addr and len(addr) > 5:
+                if any(city in addr.lower() for city in ['minneapolis', 'st paul', 'brooklyn']):
+                    building_data['full_address'] = addr
+                    logger.info(f"Found COMPLETE address: {addr}")
+                    address_found = True
+                    break
+                else:
+                    street_only = addr.rstrip(',').strip()
+                    logger.info(f"Found street address: {street_only}")
 
         if not address_found and street_only:
             building_data['full_address'] = f"{street_only}, {city_state_from_url}"
@@ -1023,73 +1595,38 @@ async def extract_building_info(page: Page, url: str) -> Dict[str, Any]:
 
         # Meta tags
         if not address_found:
-            try:
-                meta_street = await page.locator('meta[property="og:street-address"]').get_attribute('content')
-                meta_city = await page.locator('meta[property="og:locality"]').get_attribute('content')
-                meta_state = await page.locator('meta[property="og:region"]').get_attribute('content')
-                meta_zip = await page.locator('meta[property="og:postal-code"]').get_attribute('content')
-                if meta_street and meta_city:
-                    building_data['full_address'] = f"{meta_street}, {meta_city}, {meta_state} {meta_zip}"
-                    logger.info(f"Found address (via meta): {building_data['full_address']}")
-                    address_found = True
-            except:
-                pass
-
-        # JSON-LD: try to extract address and geo coordinates (prefer page-provided coords)
-        try:
-            script_elems = await page.locator('script[type="application/ld+json"]').all()
-            for script in script_elems:
-                try:
-                    json_text = await script.inner_text()
-                    data = json.loads(json_text)
-                    items = data if isinstance(data, list) else [data]
-                    for item in items:
-                        if not isinstance(item, dict):
-                            continue
-                        addr = item.get('address') or item.get('contactPoint') or {}
-                        if isinstance(addr, dict):
-                            street = addr.get('streetAddress') or addr.get('street') or ''
-                            city = addr.get('addressLocality') or addr.get('city') or ''
-                            state = addr.get('addressRegion') or addr.get('state') or ''
-                            zipcode = addr.get('postalCode') or ''
-                            if street and city and not address_found:
-                                building_data['full_address'] = f"{street}, {city}, {state} {zipcode}".strip()
-                                logger.info(f"Found address (via JSON-LD): {building_data['full_address']}")
-                                address_found = True
-                        geo = item.get('geo') or item.get('location') or item.get('hasMap') or {}
-                        if isinstance(geo, dict):
-                            lat = geo.get('latitude') or geo.get('lat') or geo.get('lng') or geo.get('lon')
-                            lon = geo.get('longitude') or geo.get('lon') or geo.get('lng')
-                            if lat and lon:
-                                try:
-                                    building_data['lat'] = float(lat)
-                                    building_data['lon'] = float(lon)
-                                    logger.info(f"Found coordinates (via JSON-LD): {building_data['lat']}, {building_data['lon']}")
-                                except:
-                                    pass
-                    if address_found or (building_data.get('lat') is not None and building_data.get('lon') is not None):
-                        break
-                except:
-                    pass
-        except:
-            pass
+            meta_street, meta_city = dom['meta_street'], dom['meta_city']
+            if meta_street and meta_city:
+                building_data['full_address'] = f"{meta_street}, {meta_city}, {dom['meta_state']} {dom['meta_zip']}"
+                logger.info(f"Found address (via meta): {building_data['full_address']}")
+                address_found = True
+
+        # JSON-LD: try to extract address and geo coordinates (prefer page-provided coords).
+        # Decoding runs in a worker thread so a large blob doesn't stall the other workers.
+        if dom['json_ld']:
+            ld_address, ld_lat, ld_lon = await asyncio.to_thread(parse_json_ld, dom['json_ld'], not address_found)
+            if ld_address:
+                building_data['full_address'] = ld_address
+                logger.info(f"Found address (via JSON-LD): {ld_address}")
+                address_found = True
+            if ld_lat is not None and ld_lon is not None:
+                building_data['lat'] = ld_lat
+                building_data['lon'] = ld_lon
+                logger.info(f"Found coordinates (via JSON-LD): {ld_lat}, {ld_lon}")
 
         # Map coords fallback
         if not address_found:
             try:
-                map_elem = page.locator('#map, [id*="map"]').first
-                if await map_elem.count() > 0:
-                    lat_attr = await map_elem.get_attribute('data-latitude')
-                    lon_attr = await map_elem.get_attribute('data-longitude')
-                    if lat_attr and lon_attr:
-                        building_data['lat'] = float(lat_attr)
-                        building_data['lon'] = float(lon_attr)
-                        logger.info(f"Found coordinates: {building_data['lat']}, {building_data['lon']}")
-                        if street_only:
-                            building_data['full_address'] = f"{street_only}, {city_state_from_url}"
-                        else:
-                            building_data['full_address'] = f"{building_data['building_name']}, {city_state_from_url}"
-                        address_found = True
+                lat_attr, lon_attr = dom['map_lat'], dom['map_lon']
+                if lat_attr and lon_attr:
+                    building_data['lat'] = float(lat_attr)
+                    building_data['lon'] = float(lon_attr)
+                    logger.info(f"Found coordinates: {building_data['lat']}, {building_data['lon']}")
+                    if street_only:
+                        building_data['full_address'] = f"{street_only}, {city_state_from_url}"
+                    else:
+                        building_data['full_address'] = f"{building_data['building_name']}, {city_state_from_url}"
+                    address_found = True
             except:
                 pass
 
@@ -1103,12 +1640,15 @@ async def extract_building_info(page: Page, url: str) -> Dict[str, Any]:
 
         if building_data['full_address']:
             address_parts = parse_address(building_data['full_address'])
-            building_data.update(address_parts)
+            building_data.update(address_parts._asdict())
 
-        body_text = await page.locator('body').inner_text()
-        building_data['full_page_text'] = body_text
+        body_text = dom['body'] or ""
+        # Per-bed / shared-bedroom wording anywhere on the page applies to every unit row
+        body_lower = body_text.lower()
+        building_data['page_per_bed'] = PER_BED_RE.search(body_lower) is not None
+        building_data['page_shared_bedroom'] = SHARED_BEDROOM_RE.search(body_lower) is not None
         building_data['is_student_branded'] = is_student_housing(body_text)
-        building_data['amenities'] = await extract_amenities(page)
+        building_data['amenities'] = extract_amenities(body_text)
 
     except Exception as e:
         logger.error(f"Error extracting building info: {e}")
@@ -1116,47 +1656,31 @@ async def extract_building_info(page: Page, url: str) -> Dict[str, Any]:
     return building_data
 
 
-async def extract_amenities(page: Page) -> Dict[str, bool]:
-    amenities = {
-        'has_in_unit_laundry': None,
-        'has_on_site_laundry': None,
-        'has_dishwasher': None,
-        'has_ac': None,
-        'has_heat_included': None,
-        'has_water_included': None,
-        'has_internet_included': None,
-        'is_furnished': None,
-        'has_gym': None,
-        'has_pool': None,
-        'has_rooftop_or_clubroom': None,
-        'has_parking_available': None,
-        'has_garage': None,
-        'pets_allowed': None,
-    }
+def extract_amenities(body_text: str) -> Dict[str, bool]:
+    amenities = dict.fromkeys(AMENITY_KEYWORDS)
     try:
-        body_text = await page.locator('body').inner_text()
-        amenity_text = (body_text or "").lower()
-        amenities['has_in_unit_laundry'] = check_amenity(amenity_text,
-                                                       ['in-unit laundry', 'washer/dryer in unit', 'in unit washer'])
-        amenities['has_on_site_laundry'] = check_amenity(amenity_text, ['on-site laundry', 'laundry facilities'])
-        amenities['has_dishwasher'] = check_amenity(amenity_text, ['dishwasher'])
-        amenities['has_ac'] = check_amenity(amenity_text, ['air conditioning', 'central air', 'a/c'])
-        amenities['has_heat_included'] = check_amenity(amenity_text, ['heat included'])
-        amenities['has_water_included'] = check_amenity(amenity_text, ['water included'])
-        amenities['has_internet_included'] = check_amenity(amenity_text, ['internet included', 'wifi included'])
-        amenities['is_furnished'] = check_amenity(amenity_text, ['furnished'])
-        amenities['has_gym'] = check_amenity(amenity_text, ['fitness center', 'gym'])
-        amenities['has_pool'] = check_amenity(amenity_text, ['pool'])
-        amenities['has_rooftop_or_clubroom'] = check_amenity(amenity_text, ['rooftop', 'clubhouse'])
-        amenities['has_parking_available'] = check_amenity(amenity_text, ['parking'])
-        amenities['has_garage'] = check_amenity(amenity_text, ['garage'])
-        amenities['pets_allowed'] = check_amenity(amenity_text, ['pet friendly', 'pets allowed'])
+        found = find_amenities(body_text or "")
+        for name in amenities:
+            amenities[name] = name in found
     except Exception as e:
         logger.error(f"Error extracting amenities: {e}")
     return amenities
 
 
-async def extract_units(page: Page, building_data: Dict[str, Any]) -> List[UnitListing]:
+# Text plus the pricing data-* attributes apartments.com puts on floorplan rows
+UNIT_ROWS_JS = """
+els => els.map(e => ({
+    text: e.innerText,
+    beds: e.dataset.beds,
+    baths: e.dataset.baths,
+    sqft: e.dataset.sqft,
+    minRent: e.dataset.minrent,
+    maxRent: e.dataset.maxrent
+}))
+"""
+
+
+async def extract_units(page: "Page", building_data: Dict[str, Any]) -> List[UnitListing]:
     units: List[UnitListing] = []
     try:
         selectors = [
@@ -1167,22 +1691,21 @@ async def extract_units(page: Page, building_data: Dict[str, Any]) -> List[UnitL
             '.floorplan-row',
             '[data-tid="floorplan"]'
         ]
-        floorplan_rows = None
+        rows_data: List[Dict[str, Any]] = []
         for selector in selectors:
-            floorplan_rows = page.locator(selector)
-            num_rows = await floorplan_rows.count()
-            if num_rows > 0:
-                logger.info(f"Found {num_rows} floorplans using selector: {selector}")
+            # One round-trip returns every row's text and data-* attributes
+            rows_data = await page.eval_on_selector_all(selector, UNIT_ROWS_JS)
+            if rows_data:
+                logger.info(f"Found {len(rows_data)} floorplans using selector: {selector}")
                 break
 
-        if not floorplan_rows or await floorplan_rows.count() == 0:
+        if not rows_data:
             logger.warning("No floorplan rows found")
             return units
 
-        for i in range(await floorplan_rows.count()):
+        for i, row_data in enumerate(rows_data):
             try:
-                row = floorplan_rows.nth(i)
-                unit = await parse_unit_row(row, building_data)
+                unit = parse_unit_row(row_data, building_data)
                 if unit:
                     units.append(unit)
             except Exception as e:
@@ -1194,19 +1717,47 @@ async def extract_units(page: Page, building_data: Dict[str, Any]) -> List[UnitL
     return units
 
 
-async def parse_unit_row(row, building_data: Dict[str, Any]) -> Optional[UnitListing]:
+def dataset_number(value: Optional[str], cast: Callable[[str], Any] = float) -> Optional[Any]:
+    """Numeric data-* attribute value, or None when it is missing or not a plain number."""
+    if not value:
+        return None
+    try:
+        return cast(value.replace(',', '').replace('$', '').strip())
+    except ValueError:
+        return None
+
+
+def parse_unit_row(row_data: Dict[str, Any], building_data: Dict[str, Any]) -> Optional[UnitListing]:
+    """
+    Build a UnitListing from one floorplan row as returned by UNIT_ROWS_JS.
+
+    Beds/baths/sqft/rent come from the row's data-* attributes when the page provides
+    them; the row text is only parsed for whatever is missing.
+    """
     try:
-        row_text = await row.inner_text()
-        beds = parse_bedroom_count(row_text)
-        baths = parse_bathroom_count(row_text)
-        sqft = parse_sqft(row_text)
+        row_text = row_data.get('text') or ""
+        beds = dataset_number(row_data.get('beds'))
+        baths = dataset_number(row_data.get('baths'))
+        sqft = dataset_number(row_data.get('sqft'), int)
+        if beds is None or baths is None or sqft is None:
+            specs = parse_unit_specs(row_text)
+            beds = specs['beds'] if beds is None else beds
+            baths = specs['baths'] if baths is None else baths
+            sqft = specs['sqft'] if sqft is None else sqft
         rent_raw = ""
-        rent_match = re.search(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?', row_text)
-        if rent_match:
-            rent_raw = rent_match.group(0)
+        min_rent = dataset_number(row_data.get('minRent'), int)
+        if min_rent:
+            max_rent = dataset_number(row_data.get('maxRent'), int)
+            rent_raw = f"${min_rent:,}" if not max_rent or max_rent == min_rent else f"${min_rent:,} - ${max_rent:,}"
+        else:
+            rent_match = RENT_RE.search(row_text)
+            if rent_match:
+                rent_raw = rent_match.group(0)
         if not rent_raw or 'call' in rent_raw.lower():
             return None
-        price_info = parse_price_text(rent_raw, building_data.get('full_page_text', ''))
+        price_info = parse_price_text(
+            rent_raw, building_data.get('page_per_bed', False), building_data.get('page_shared_bedroom', False)
+        )
         unit = UnitListing(
             listing_id=f"{building_data['source_url'].split('/')[-2]}-{beds or 0}bed",
             building_name=building_data['building_name'],
@@ -1221,10 +1772,10 @@ async def parse_unit_row(row, building_data: Dict[str, Any]) -> Optional[UnitLis
             baths=baths,
             sqft=sqft,
             rent_raw=rent_raw,
-            rent_min=price_info['rent_min'],
-            rent_max=price_info['rent_max'],
-            price_type=price_info['price_type'],
-            is_per_bed=price_info['is_per_bed'],
+            rent_min=price_info.rent_min,
+            rent_max=price_info.rent_max,
+            price_type=price_info.price_type,
+            is_per_bed=price_info.is_per_bed,
             is_student_branded=building_data.get('is_student_branded', False),
             source_url=building_data['source_url']
         )
@@ -1237,28 +1788,42 @@ async def parse_unit_row(row, building_data: Dict[str, Any]) -> Optional[UnitLis
 
 
 def sample_units(units: List[UnitListing]) -> List[UnitListing]:
-    if not units:
-        return []
-    by_beds: Dict[float, List[UnitListing]] = {}
-    for unit in units:
-        if unit.beds is not None and unit.rent_min is not None:
-            if unit.beds not in by_beds:
-                by_beds[unit.beds] = []
-            by_beds[unit.beds].append(unit)
-    selected: List[UnitListing] = []
-    if 1.0 in by_beds:
-        selected.append(max(by_beds[1.0], key=lambda u: (u.sqft is not None, u.sqft or 0)))
-    if 2.0 in by_beds:
-        selected.append(max(by_beds[2.0], key=lambda u: (u.sqft is not None, u.sqft or 0)))
+    """
+    Pick up to two representative units: the largest 1-bed and 2-bed, topped up with
+    the first units in (has_sqft, beds, sqft) order. One pass over the units.
+    """
+    # beds -> ((has_sqft, sqft), unit) for the largest priced 1- and 2-bed units
+    best: Dict[float, Tuple[Tuple[bool, float], UnitListing]] = {}
+    # Fallback candidates: the three lowest (has_sqft, beds, sqft, position) keys, kept as a
+    # heap of negated keys so heap[0] is the one to drop. Three is enough because at most
+    # one unit is already selected when the fallback is needed.
+    fallback: List[Tuple[Any, ...]] = []
+    for idx, unit in enumerate(units):
+        if unit.rent_min is None:
+            continue
+        has_sqft = unit.sqft is not None
+        sqft = unit.sqft or 0
+        if unit.beds == 1.0 or unit.beds == 2.0:
+            size_key = (has_sqft, sqft)
+            current = best.get(unit.beds)
+            if current is None or size_key > current[0]:
+                best[unit.beds] = (size_key, unit)
+        entry = (-has_sqft, -(unit.beds or 0), -sqft, -idx, unit)
+        if len(fallback) < 3:
+            heapq.heappush(fallback, entry)
+        else:
+            heapq.heappushpop(fallback, entry)
+
+    selected = [best[beds][1] for beds in (1.0, 2.0) if beds in best]
     if len(selected) < 2:
-        remaining = [u for u in units if u not in selected and u.rent_min is not None]
-        if remaining:
-            remaining.sort(key=lambda u: (u.sqft is not None, u.beds or 0, u.sqft or 0))
-            for unit in remaining:
-                if unit not in selected:
-                    selected.append(unit)
-                    if len(selected) >= 2:
-                        break
+        # Membership by identity: `in selected` would compare every dataclass field
+        selected_ids = {id(u) for u in selected}
+        for entry in sorted(fallback, reverse=True):
+            unit = entry[-1]
+            if id(unit) not in selected_ids:
+                selected.append(unit)
+                if len(selected) >= 2:
+                    break
     return selected[:2]
 
 
@@ -1287,40 +1852,61 @@ def geocode_and_filter_units(units: List[UnitListing], existing_ids: Set[str] =
         logger.info("No new units to geocode")
         return []
     
+    out_of_area = 0
+    in_area: List[UnitListing] = []
+    for unit in units:
+        # parse_address takes the first 5-digit word, which may be a house number
+        if unit.zip and unit.zip[:3] not in METRO_ZIP_PREFIXES and unit.zip not in unit.street:
+            out_of_area += 1
+        else:
+            in_area.append(unit)
+    if out_of_area:
+        logger.info(f"Excluded {out_of_area} units outside the Twin Cities ZIP area before geocoding")
+        units = in_area
+    
+    # Grouped by the geocode cache key, so spellings differing only in case or spacing
+    # share one lookup
     by_address: Dict[str, List[UnitListing]] = {}
     for unit in units:
-        addr = unit.full_address or ""
-        if addr not in by_address:
-            by_address[addr] = []
-        by_address[addr].append(unit)
+        key = normalize_address(unit.full_address or "")
+        if key not in by_address:
+            by_address[key] = []
+        by_address[key].append(unit)
     logger.info(f"Unique addresses to geocode: {len(by_address)}")
-    for address, address_units in by_address.items():
-        if not address:
-            logger.warning("Empty address string, skipping geocode for this address key")
-            continue
-        if address_units[0].lat is None or address_units[0].lon is None:
-            logger.info(f"Geocoding: {address}")
-            coords = geocode_address(address)
-            if coords:
-                logger.info(f"  ✓ Found: {coords['lat']:.4f}, {coords['lon']:.4f}")
-                for unit in address_units:
-                    unit.lat = coords['lat']
-                    unit.lon = coords['lon']
+    if "" in by_address:
+        logger.warning("Empty address string, skipping geocode for this address key")
+    # Geocode each group under its first unit's address as written
+    to_geocode = {address_units[0].full_address: key for key, address_units in by_address.items()
+                  if key and (address_units[0].lat is None or address_units[0].lon is None)}
+    for address, coords in geocode_addresses(to_geocode).items():
+        if coords:
+            logger.info(f"  ✓ Found {address}: {coords['lat']:.4f}, {coords['lon']:.4f}")
+            for unit in by_address[to_geocode[address]]:
+                unit.lat = coords['lat']
+                unit.lon = coords['lon']
     filtered: List[UnitListing] = []
     excluded_too_far = 0
+    located: List[UnitListing] = []
     for unit in units:
         if unit.lat is not None and unit.lon is not None:
-            dist = haversine_distance(unit.lat, unit.lon, UMN_CAMPUS_LAT, UMN_CAMPUS_LON)
-            unit.dist_to_campus_km = round(dist, 2)
-            logger.info(f"{unit.building_name}: {dist:.2f} km from UMN")
-            if dist <= SEARCH_RADIUS_KM:
-                filtered.append(unit)
-                logger.info("  ✓ INCLUDED (within 10km)")
-            else:
-                excluded_too_far += 1
-                logger.info(f"  ✗ EXCLUDED (>{SEARCH_RADIUS_KM}km from UMN - too far)")
+            located.append(unit)
         else:
             logger.warning(f"Could not geocode: {unit.full_address}")
+    # Distances for every geocoded unit in one vectorized pass
+    dists = haversine_to_batch(
+        UMN_CAMPUS_ANCHOR,
+        np.fromiter((u.lat for u in located), dtype=float, count=len(located)),
+        np.fromiter((u.lon for u in located), dtype=float, count=len(located)),
+    )
+    for unit, dist in zip(located, dists.tolist()):
+        unit.dist_to_campus_km = round(dist, 2)
+        logger.info(f"{unit.building_name}: {dist:.2f} km from UMN")
+        if dist <= SEARCH_RADIUS_KM:
+            filtered.append(unit)
+            logger.info("  ✓ INCLUDED (within 10km)")
+        else:
+            excluded_too_far += 1
+            logger.info(f"  ✗ EXCLUDED (>{SEARCH_RADIUS_KM}km from UMN - too far)")
     if excluded_too_far > 0:
         logger.info(f"Excluded {excluded_too_far} units for being >{SEARCH_RADIUS_KM}km from UMN")
     logger.info(f"Filtered to {len(filtered)} units within {SEARCH_RADIUS_KM} km of UMN")
@@ -1329,19 +1915,42 @@ def geocode_and_filter_units(units: List[UnitListing], existing_ids: Set[str] =
 
 def export_to_csv(units: List[UnitListing], filename: Path):
     """Export unit listings to CSV file. Always writes header so file exists even if empty."""
-    fieldnames = list(UnitListing.__dataclass_fields__.keys())
     logger.info(f"Exporting {len(units)} units to {filename}")
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        if units:
-            rows = [asdict(u) for u in units]
-            writer.writerows(rows)
+    write_units_csv(units, filename)
     logger.info(f"Export complete: {filename}")
 
 
+async def save_session_results(filtered_units: List[UnitListing], index: CombinedIndex) -> List[UnitListing]:
+    """Dedupe filtered units against `index`, then write the session CSV and update the combined CSV.
+
+    The two files are independent, so they are written concurrently in worker threads.
+    `index` is updated with the added units (all within the radius). Returns the units
+    that were new to the combined data.
+    """
+    added_units = merge_and_dedupe_units(filtered_units, index.ids)
+    index.in_radius += len(added_units)
+    index.source_urls.update(u.source_url for u in added_units if u.source_url)
+    await asyncio.gather(
+        asyncio.to_thread(export_to_csv, filtered_units, OUTPUT_CSV),
+        asyncio.to_thread(append_combined_csv, added_units, PERSISTENT_CSV),
+    )
+    return added_units
+
+
+def open_units_csv(filename: Path):
+    """Open a units CSV for streaming as buildings finish; the header is written immediately.
+
+    Returns (file, write) where write(units) appends rows. The caller closes the file.
+    """
+    f = open(filename, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER)
+    writer = csv.writer(f, lineterminator=CSV_LINETERMINATOR)
+    writer.writerow(FIELDNAMES)
+    return f, lambda units: writer.writerows(map(unit_row, units))
+
+
 async def main(headless: bool = True, max_search_pages: int = 25, max_buildings: int = None, 
-               skip_scraped: bool = False, search_location: str = None, start_page: int = 1) -> int:
+               skip_scraped: bool = False, search_location: str = None, start_page: int = 1,
+               browser: Optional["Browser"] = None, index: Optional[CombinedIndex] = None) -> int:
     """
     Main scraping function. Returns the number of units scraped in this session.
     
@@ -1352,10 +1961,15 @@ async def main(headless: bool = True, max_search_pages: int = 25, max_buildings:
         skip_scraped: Skip buildings that were already scraped (for auto-restart mode)
         search_location: Location to search (defaults to SEARCH_LOCATION if not specified)
         start_page: Search result page to start from (1 = first, 2+ = skip ahead to find different buildings)
+        browser: Already-running browser to use (left open); a new one is launched if None
+        index: Combined-CSV index kept across sessions (updated in place); loaded from
+            PERSISTENT_CSV if None
     
     Returns:
         Number of units scraped in this session
     """
+    global _CURRENT_SCRAPE_ISO
+    _CURRENT_SCRAPE_ISO = datetime.now().isoformat()
     location = search_location or SEARCH_LOCATION
     logger.info("="*80)
     logger.info("UMN HOUSING SCRAPER STARTED")
@@ -1370,117 +1984,92 @@ async def main(headless: bool = True, max_search_pages: int = 25, max_buildings:
     logger.info(f"Output file: {OUTPUT_CSV}")
 
     all_units: List[UnitListing] = []
-    scraped_urls = load_scraped_urls(SCRAPED_URLS_FILE) if skip_scraped else set()
     consecutive_failures = 0
     max_consecutive_failures = 10  # Stop session if too many failures in a row
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-http2',  # Fix for ERR_HTTP2_PROTOCOL_ERROR
-            ]
-        )
-
-        # Select a random user agent to help avoid detection
-        selected_user_agent = random.choice(USER_AGENTS)
-        logger.info(f"Using user agent: {selected_user_agent[:50]}...")
-
-        context = await browser.new_context(
-            user_agent=selected_user_agent,
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/Chicago',
-            extra_http_headers={
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-            }
-        )
+    # Parse the combined CSV in the background while the browser starts up
+    existing_task = None if index is not None else asyncio.create_task(load_combined_index_async(PERSISTENT_CSV))
 
-        page = await context.new_page()
+    async with session_browser(headless, browser) as browser:
+        # Fresh contexts every session, so cookies/fingerprints don't carry over
+        pool = await open_context_pool(browser)
+        limiter = new_navigation_limiter()
+        # Unfiltered rows go to disk as each building finishes, not in one write at the end
+        all_csv, write_all_units = open_units_csv(OUTPUT_CSV_ALL)
 
         try:
-            building_urls = await search_apartments(page, location, max_search_pages, start_page)
-
-            # Filter out already-scraped URLs
-            if skip_scraped and scraped_urls:
+            async with pooled_page(pool) as page:
+                # Already-scraped buildings are filtered out at the end of the search
+                building_urls = await search_apartments(
+                    page, location, max_search_pages, start_page, limiter,
+                    scraped_urls_file=SCRAPED_URLS_FILE if skip_scraped else None,
+                )
+
+            if skip_scraped:
+                # Also skip buildings already in the combined CSV but never recorded in the
+                # tracking file (imported or hand-merged data)
+                if index is None:
+                    index = await existing_task
                 original_count = len(building_urls)
-                building_urls = [url for url in building_urls if url not in scraped_urls]
-                logger.info(f"Filtered out {original_count - len(building_urls)} already-scraped buildings")
+                building_urls = [url for url in building_urls if url not in index.source_urls]
+                if original_count > len(building_urls):
+                    logger.info(f"Filtered out {original_count - len(building_urls)} buildings already in {PERSISTENT_CSV}")
 
             if max_buildings:
                 building_urls = building_urls[:max_buildings]
                 logger.info(f"Limited to {max_buildings} buildings for testing")
 
-            for idx, url in enumerate(building_urls, 1):
-                logger.info(f"Processing building {idx}/{len(building_urls)}")
-                try:
-                    units = await scrape_building(page, url)
-                    if units:
-                        all_units.extend(units)
-                        consecutive_failures = 0  # Reset on success
-                        # Track this URL as scraped
-                        save_scraped_url(SCRAPED_URLS_FILE, url)
-                    else:
-                        consecutive_failures += 1
-                    logger.info(f"Total units collected: {len(all_units)}")
-                except Exception as e:
-                    logger.error(f"Failed to scrape {url}: {e}")
+            def handle_result(idx: int, url: str, outcome) -> bool:
+                nonlocal consecutive_failures
+                if isinstance(outcome, Exception):
+                    logger.error(f"Failed to scrape {url}: {outcome}")
                     consecutive_failures += 1
-                    
+
                     # Check for bot detection indicators
-                    error_str = str(e).lower()
-                    if 'access denied' in error_str or 'blocked' in error_str or 'captcha' in error_str:
+                    if BOT_DETECT_RE.search(str(outcome).lower()):
                         logger.warning("Bot detection likely triggered!")
                         if consecutive_failures >= 3:
                             logger.error("Multiple consecutive failures - ending session early")
-                            break
+                            return False
+                elif outcome:
+                    all_units.extend(outcome)
+                    write_all_units(outcome)
+                    consecutive_failures = 0  # Reset on success
+                    # Track this URL as scraped
+                    save_scraped_url(SCRAPED_URLS_FILE, url)
+                    logger.info(f"Total units collected: {len(all_units)}")
+                else:
+                    consecutive_failures += 1
 
                 if consecutive_failures >= max_consecutive_failures:
                     logger.error(f"Too many consecutive failures ({consecutive_failures}) - ending session")
-                    break
+                    return False
+                return True
 
-                # Use randomized delay to avoid detection patterns
-                delay = get_random_delay()
-                logger.debug(f"Waiting {delay:.1f}s before next building...")
-                await asyncio.sleep(delay)
+            await scrape_buildings_concurrently(pool, building_urls, handle_result, limiter=limiter)
 
         finally:
-            await browser.close()
+            all_csv.close()
+            close_scraped_url_files()
+            await close_context_pool(pool)
 
-    # Save ALL data first (before filtering)
-    logger.info("Saving unfiltered data...")
-    export_to_csv(all_units, OUTPUT_CSV_ALL)
+    logger.info(f"Saved {len(all_units)} unfiltered units to {OUTPUT_CSV_ALL}")
 
-    # Load existing listings to skip geocoding duplicates
-    existing_listings = load_existing_listings(PERSISTENT_CSV)
-    existing_ids = set(existing_listings.keys())
+    # Existing listing IDs (loaded in the background) let us skip geocoding duplicates
+    if index is None:
+        index = await existing_task
     
-    # Now filter and save filtered data (skipping already-known duplicates before geocoding)
-    filtered_units = geocode_and_filter_units(all_units, existing_ids)
-    export_to_csv(filtered_units, OUTPUT_CSV)
-
-    # Merge with existing data (don't reload - use what we already have)
-    merged_units = merge_and_dedupe_units(filtered_units, existing_listings)
-    export_combined_csv(merged_units, PERSISTENT_CSV)
+    # Now filter and save filtered data (skipping already-known duplicates before geocoding),
+    # deduping against the IDs we already have rather than reloading the file
+    filtered_units = geocode_and_filter_units(all_units, index.ids)
+    await save_session_results(filtered_units, index)
 
     logger.info("="*80)
     logger.info("SCRAPING COMPLETE")
     logger.info("="*80)
     logger.info(f"This session scraped: {len(all_units)} units")
     logger.info(f"Units within {SEARCH_RADIUS_KM} km: {len(filtered_units)}")
-    logger.info(f"Total accumulated (deduplicated): {len(merged_units)}")
+    logger.info(f"Total accumulated (deduplicated): {len(index.ids)}")
     logger.info(f"Unique buildings: {len(set(u.building_name for u in filtered_units))}")
     logger.info(f"Student-branded properties: {sum(1 for u in filtered_units if u.is_student_branded)}")
     logger.info(f"Per-bed pricing detected: {sum(1 for u in filtered_units if u.is_per_bed)}")
@@ -1537,95 +2126,117 @@ async def auto_restart_scraper(headless: bool = True, max_search_pages: int = 25
     
     # Load location scrape counts for balanced coverage
     location_counts = load_location_counts(LOCATION_COUNTER_FILE)
+    location_queue = build_location_queue(SEARCH_LOCATIONS, location_counts)
     logger.info("Using balanced location ordering (least-scraped first)")
     
     total_scraped = 0
     session_num = 0
     zero_sessions_in_a_row = 0
     
-    while session_num < max_sessions:
-        session_num += 1
-        
-        # Get balanced location order (least-scraped locations first)
-        balanced_locations = get_balanced_location_order(SEARCH_LOCATIONS, location_counts)
-        
-        # Pick the first location (least scraped)
-        current_location = balanced_locations[0]
-        current_count = location_counts.get(current_location, 0)
-        
-        logger.info(f"\n{'='*80}")
-        logger.info(f"STARTING SESSION {session_num}/{max_sessions}")
-        logger.info(f"Searching: {current_location}")
-        logger.info(f"URL: https://www.apartments.com/{current_location}/")
-        logger.info(f"Previously scraped this location: {current_count} times")
-        logger.info(f"Will scrape up to {max_search_pages} pages")
-        logger.info(f"{'='*80}\n")
-        
-        try:
-            # ALWAYS start from page 1 to get ALL buildings in each location
-            # The key to finding unique listings is searching DIFFERENT locations,
-            # not skipping to later pages of the same location
-            units_scraped = await main(
-                headless=headless,
-                max_search_pages=max_search_pages,
-                max_buildings=max_buildings,
-                skip_scraped=True,
-                search_location=current_location,
-                start_page=1  # Always start from page 1
-            )
-            total_scraped += units_scraped
+    # One browser process serves every session (each session opens fresh contexts);
+    # it is relaunched only if it has crashed or disconnected
+    from playwright.async_api import async_playwright
+
+    # Read the combined CSV once; sessions keep it current as they add listings
+    index = load_combined_index(PERSISTENT_CSV)
+
+    playwright = await async_playwright().start()
+    browser = None
+    try:
+        while session_num < max_sessions:
+            session_num += 1
             
-            # Update and save location count
-            location_counts[current_location] = location_counts.get(current_location, 0) + 1
-            save_location_counts(LOCATION_COUNTER_FILE, location_counts)
+            # Pick the least-scraped location; it is requeued once the session finishes
+            current_count, _, current_location = heapq.heappop(location_queue)
+            requeued = False
             
-            # Check if we've reached target
-            existing = load_existing_listings(PERSISTENT_CSV)
-            total_listings = len(existing)
-            logger.info(f"Total accumulated listings: {total_listings}")
+            logger.info(f"\n{'='*80}")
+            logger.info(f"STARTING SESSION {session_num}/{max_sessions}")
+            logger.info(f"Searching: {current_location}")
+            logger.info(f"URL: https://www.apartments.com/{current_location}/")
+            logger.info(f"Previously scraped this location: {current_count} times")
+            logger.info(f"Will scrape up to {max_search_pages} pages")
+            logger.info(f"{'='*80}\n")
             
-            if total_listings >= target_listings:
-                logger.info(f"✓ Reached target of {target_listings} listings!")
-                break
+            try:
+                # ALWAYS start from page 1 to get ALL buildings in each location
+                # The key to finding unique listings is searching DIFFERENT locations,
+                # not skipping to later pages of the same location
+                if browser is None or not browser.is_connected():
+                    browser = await playwright.chromium.launch(headless=headless, args=BROWSER_LAUNCH_ARGS)
+                units_scraped = await main(
+                    headless=headless,
+                    max_search_pages=max_search_pages,
+                    max_buildings=max_buildings,
+                    skip_scraped=True,
+                    search_location=current_location,
+                    start_page=1,  # Always start from page 1
+                    browser=browser,
+                    index=index,
+                )
+                total_scraped += units_scraped
                 
-            if units_scraped == 0:
-                zero_sessions_in_a_row += 1
-                logger.warning(f"Session produced 0 units - may be blocked ({zero_sessions_in_a_row} in a row)")
+                # Update and save location count
+                location_counts[current_location] = current_count + 1
+                save_location_counts(LOCATION_COUNTER_FILE, location_counts)
+                requeue_location(location_queue, current_location, current_count + 1)
+                requeued = True
                 
-                # If we've had multiple zeros, the location may be exhausted or blocked
-                # The balanced ordering will automatically move to another location next time
-                if zero_sessions_in_a_row >= 3:
-                    logger.info("Multiple zero sessions - bot detection may be active")
-                    zero_sessions_in_a_row = 0
+                # Check if we've reached target
+                total_listings = index.in_radius
+                logger.info(f"Total accumulated listings: {total_listings}")
                 
-                # Increase cooldown if blocked
-                extended_cooldown = session_cooldown * 2
-                logger.info(f"Extended cooldown: {extended_cooldown} seconds")
-                await asyncio.sleep(extended_cooldown)
-            else:
-                zero_sessions_in_a_row = 0  # Reset on success
-                if session_num < max_sessions:
-                    # Add some randomness to cooldown timing
-                    actual_cooldown = session_cooldown + random.randint(-60, 120)
-                    actual_cooldown = max(60, actual_cooldown)  # At least 1 minute
-                    logger.info(f"Cooling down for {actual_cooldown} seconds before next session...")
-                    await asyncio.sleep(actual_cooldown)
-                
-        except KeyboardInterrupt:
-            logger.info("Interrupted by user - stopping auto-restart")
-            break
-        except Exception as e:
-            logger.error(f"Session {session_num} failed with error: {e}")
-            logger.info(f"Waiting {session_cooldown} seconds before retry...")
-            await asyncio.sleep(session_cooldown)
-    
+                if total_listings >= target_listings:
+                    logger.info(f"✓ Reached target of {target_listings} listings!")
+                    break
+                    
+                if units_scraped == 0:
+                    zero_sessions_in_a_row += 1
+                    logger.warning(f"Session produced 0 units - may be blocked ({zero_sessions_in_a_row} in a row)")
+                    
+                    # If we've had multiple zeros, the location may be exhausted or blocked
+                    # The balanced ordering will automatically move to another location next time
+                    if zero_sessions_in_a_row >= 3:
+                        logger.info("Multiple zero sessions - bot detection may be active")
+                        zero_sessions_in_a_row = 0
+                    
+                    # Increase cooldown if blocked
+                    extended_cooldown = session_cooldown * 2
+                    logger.info(f"Extended cooldown: {extended_cooldown} seconds")
+                    await asyncio.sleep(extended_cooldown)
+                else:
+                    zero_sessions_in_a_row = 0  # Reset on success
+                    if session_num < max_sessions:
+                        # Add some randomness to cooldown timing
+                        actual_cooldown = session_cooldown + random.randint(-60, 120)
+                        actual_cooldown = max(60, actual_cooldown)  # At least 1 minute
+                        logger.info(f"Cooling down for {actual_cooldown} seconds before next session...")
+                        await asyncio.sleep(actual_cooldown)
+                    
+            except KeyboardInterrupt:
+                logger.info("Interrupted by user - stopping auto-restart")
+                break
+            except Exception as e:
+                logger.error(f"Session {session_num} failed with error: {e}")
+                if not requeued:
+                    requeue_location(location_queue, current_location, current_count)
+                logger.info(f"Waiting {session_cooldown} seconds before retry...")
+                await asyncio.sleep(session_cooldown)
+        
+    finally:
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            await playwright.stop()
+
     # Final summary
-    existing = load_existing_listings(PERSISTENT_CSV)
+    total_listings = index.in_radius
     logger.info("\n" + "="*80)
     logger.info("AUTO-RESTART COMPLETE")
     logger.info("="*80)
     logger.info(f"Sessions run: {session_num}")
-    logger.info(f"Total unique listings collected: {len(existing)}")
+    logger.info(f"Total unique listings collected: {total_listings}")
     logger.info(f"Combined data file: {PERSISTENT_CSV}")
     
     # Show location coverage
@@ -1756,83 +2367,48 @@ async def scrape_direct_urls(urls: List[str], headless: bool = True) -> int:
     Returns:
         Number of units scraped
     """
+    global _CURRENT_SCRAPE_ISO
+    _CURRENT_SCRAPE_ISO = datetime.now().isoformat()
     logger.info("="*80)
     logger.info("DIRECT URL SCRAPING MODE")
     logger.info("="*80)
+    urls = list(dict.fromkeys(urls))  # drop repeats, keep the given order
     logger.info(f"URLs to scrape: {len(urls)}")
     logger.info(f"Headless mode: {headless}")
     
     all_units: List[UnitListing] = []
+    existing_task = asyncio.create_task(load_combined_index_async(PERSISTENT_CSV))
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-http2',
-            ]
-        )
-        
-        selected_user_agent = random.choice(USER_AGENTS)
-        logger.info(f"Using user agent: {selected_user_agent[:50]}...")
-        
-        context = await browser.new_context(
-            user_agent=selected_user_agent,
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/Chicago',
-            extra_http_headers={
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-            }
-        )
-        
-        page = await context.new_page()
+    async with session_browser(headless) as browser:
+        pool = await open_context_pool(browser)
+        limiter = new_navigation_limiter()
+        all_csv, write_all_units = open_units_csv(OUTPUT_CSV_ALL)
         
         try:
-            for idx, url in enumerate(urls, 1):
-                logger.info(f"Processing URL {idx}/{len(urls)}: {url}")
-                try:
-                    units = await scrape_building(page, url)
-                    if units:
-                        all_units.extend(units)
-                        logger.info(f"  ✓ Got {len(units)} units")
-                    else:
-                        logger.warning(f"  ✗ No units found")
-                except Exception as e:
-                    logger.error(f"  ✗ Failed: {e}")
-                
-                # Delay between buildings
-                if idx < len(urls):
-                    delay = get_random_delay()
-                    logger.info(f"Waiting {delay:.1f}s before next URL...")
-                    await asyncio.sleep(delay)
+            def handle_result(idx: int, url: str, outcome) -> bool:
+                if isinstance(outcome, Exception):
+                    logger.error(f"  ✗ Failed {url}: {outcome}")
+                elif outcome:
+                    all_units.extend(outcome)
+                    write_all_units(outcome)
+                    logger.info(f"  ✓ Got {len(outcome)} units from {url}")
+                else:
+                    logger.warning(f"  ✗ No units found at {url}")
+                return True
+
+            await scrape_buildings_concurrently(pool, urls, handle_result, limiter=limiter)
         finally:
-            await browser.close()
-    
-    # Save and process results
-    logger.info("Saving results...")
-    export_to_csv(all_units, OUTPUT_CSV_ALL)
+            all_csv.close()
+            await close_context_pool(pool)
     
-    # Load existing and merge
-    existing_listings = load_existing_listings(PERSISTENT_CSV)
-    existing_ids = set(existing_listings.keys())
+    # Process results (the unfiltered rows were streamed to OUTPUT_CSV_ALL while scraping)
+    logger.info(f"Saved {len(all_units)} unfiltered units to {OUTPUT_CSV_ALL}")
     
-    filtered_units = geocode_and_filter_units(all_units, existing_ids)
-    export_to_csv(filtered_units, OUTPUT_CSV)
+    # Merge with existing listings (loaded in the background during scraping)
+    index = await existing_task
     
-    merged_units = merge_and_dedupe_units(filtered_units, existing_listings)
-    export_combined_csv(merged_units, PERSISTENT_CSV)
+    filtered_units = geocode_and_filter_units(all_units, index.ids)
+    await save_session_results(filtered_units, index)
     
     logger.info("="*80)
     logger.info("DIRECT URL SCRAPING COMPLETE")
@@ -1840,7 +2416,7 @@ async def scrape_direct_urls(urls: List[str], headless: bool = True) -> int:
     logger.info(f"URLs processed: {len(urls)}")
     logger.info(f"Units scraped: {len(all_units)}")
     logger.info(f"Units within radius: {len(filtered_units)}")
-    logger.info(f"Total accumulated: {len(merged_units)}")
+    logger.info(f"Total accumulated: {len(index.ids)}")
     logger.info(f"Combined data: {PERSISTENT_CSV}")
     
     return len(all_units)
@@ -1848,6 +2424,15 @@ async def scrape_direct_urls(urls: List[str], headless: bool = True) -> int:
 
 if __name__ == "__main__":
     args = parse_args()
+
+    # Turn SIGTERM into a normal exit so atexit hooks flush buffered scraped URLs
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+    try:
+        import uvloop  # optional; faster event loop for asyncio.run below
+        uvloop.install()
+    except ImportError:
+        pass
     
     # Apply turbo mode if requested (affects global delay settings)
     if args.turbo:
@@ -1862,14 +2447,14 @@ if __name__ == "__main__":
             # Load URLs from file
             try:
                 with open(args.url_file, 'r') as f:
-                    urls_to_scrape = [line.strip() for line in f if line.strip() and line.strip().startswith('http')]
+                    urls_to_scrape = [url for url in map(str.strip, f) if url.startswith('http')]
                 logger.info(f"Loaded {len(urls_to_scrape)} URLs from {args.url_file}")
             except Exception as e:
                 logger.error(f"Error loading URL file: {e}")
                 sys.exit(1)
         else:
             # Use the known scraped URLs list
-            urls_to_scrape = list(KNOWN_SCRAPED_URLS)
+            urls_to_scrape = sorted(KNOWN_SCRAPED_URLS)
             logger.info(f"Using {len(urls_to_scrape)} known URLs from KNOWN_SCRAPED_URLS")
         
         if not urls_to_scrape:
@@ -15,19 +15,26 @@ import argparse
 import asyncio
 import csv
 import logging
+import operator
 import os
 import random
 import re
 import sys
 import time
-from dataclasses import dataclass, asdict, field, fields
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from math import radians, cos, sin, asin, sqrt
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Set
 
+import numpy as np
 from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeout
-import requests
+
+from .browser import block_heavy_resources
+from .geocoding import (
+    NOMINATIM_SELF_HOSTED, NOMINATIM_URL, GeoAnchor, RateGate,
+    geocode_cache_lookup, geocode_cache_store, get_geocode_session, haversine_to_batch, normalize_address,
+)
 
 
 # ============================================================================
@@ -44,13 +51,14 @@ LISTING_PAGE = f"{BASE_URL}/listing"
 # Rate limiting settings - more conservative for university site
 PAGE_DELAY_SECONDS = 4.0
 PAGE_DELAY_VARIANCE = 3.0
-GEOCODE_DELAY_SECONDS = 1.0
+GEOCODE_DELAY_SECONDS = 0.0 if NOMINATIM_SELF_HOSTED else 1.0
+GEOCODE_WORKERS = 16 if NOMINATIM_SELF_HOSTED else 4  # Parallel geocode requests; start times are still spaced by GEOCODE_DELAY_SECONDS
+GEOCODE_USER_AGENT = "UMNHousingResearch/1.0"
 
 # Navigation settings
 NAV_TIMEOUT = 90000  # 90 seconds for page load
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 5
-
 # Scroll settings
 SCROLL_DELAY_MIN = 0.8
 SCROLL_DELAY_MAX = 2.0
@@ -76,6 +84,18 @@ LOG_FILE = OUTPUT_DIR / f"umn_listings_log_{TIMESTAMP}.log"
 # Persistent output file for accumulating results
 PERSISTENT_CSV = OUTPUT_DIR / "umn_listings_combined.csv"
 
+# scrape_date stamped on every UnitListing; refreshed once per scraping session
+_CURRENT_SCRAPE_ISO: str = datetime.now().isoformat()
+
+
+# Parsing patterns, compiled once at import. IGNORECASE is only used where the string
+# isn't lowercased anyway; BEDS_RE/BATHS_RE run on the lowercased bed/bath text.
+BED_WORD_RE = re.compile(r'bed', re.IGNORECASE)
+RENT_NUMBER_RE = re.compile(r'\d+\.?\d*')
+BEDS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:bed|br|bedroom)')
+BATHS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:bath|ba|bathroom)')
+SQFT_RE = re.compile(r'(\d+(?:,\d+)?)\s*(?:sq|sqft|sf)', re.IGNORECASE)
+
 
 # ============================================================================
 # LOGGING SETUP
@@ -96,7 +116,7 @@ logger = logging.getLogger(__name__)
 # DATA STRUCTURES (same format as apartments.com scraper for consistency)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UnitListing:
     listing_id: str
     building_name: str
@@ -146,22 +166,20 @@ class UnitListing:
     lease_term: str = ""
     property_manager: str = ""
 
-    scrape_date: str = field(default_factory=lambda: datetime.now().isoformat())
+    scrape_date: str = field(default_factory=lambda: _CURRENT_SCRAPE_ISO)
     source_url: str = ""
 
 
+FIELDNAMES = tuple(UnitListing.__dataclass_fields__.keys())
+# C-level row projector: UnitListing -> tuple of values in FIELDNAMES order
+unit_row = operator.attrgetter(*FIELDNAMES)
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two points in km."""
-    R = 6371  # Earth radius in km
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    return 2 * R * asin(sqrt(a))
+UMN_CAMPUS_ANCHOR = GeoAnchor.from_degrees(UMN_CAMPUS_LAT, UMN_CAMPUS_LON)
 
 
 def get_random_delay() -> float:
@@ -169,19 +187,38 @@ def get_random_delay() -> float:
     return PAGE_DELAY_SECONDS + random.uniform(0, PAGE_DELAY_VARIANCE)
 
 
+# Nominatim's usage policy allows ~1 request/second in total, however many threads ask
+_nominatim_gate = RateGate(GEOCODE_DELAY_SECONDS)
+
+
+def cached_geocode(address: str) -> Optional[Dict[str, float]]:
+    """Use the shared on-disk cache, falling back to Nominatim and remembering any hit.
+
+    Misses are not recorded: this scraper sends a single query with no cleaned-up
+    variants, so its misses must not stop scraper.main from trying those variants.
+    """
+    key = normalize_address(address)
+    hit, coords = geocode_cache_lookup(key)
+    if hit:
+        return coords
+    coords = geocode_address(address)
+    if coords:
+        geocode_cache_store(key, coords)
+    return coords
+
+
 def geocode_address(address: str) -> Optional[Dict[str, float]]:
     """Use Nominatim to geocode an address."""
     try:
-        time.sleep(GEOCODE_DELAY_SECONDS)  # Rate limit
-        resp = requests.get(
-            "https://nominatim.openstreetmap.org/search",
+        _nominatim_gate.wait()  # Rate limit
+        resp = get_geocode_session(GEOCODE_USER_AGENT, GEOCODE_WORKERS).get(
+            NOMINATIM_URL,
             params={
                 "q": address,
                 "format": "json",
                 "limit": 1,
                 "countrycodes": "us"
             },
-            headers={"User-Agent": "UMNHousingResearch/1.0"},
             timeout=10
         )
         resp.raise_for_status()  # Check for HTTP errors
@@ -200,37 +237,39 @@ def parse_rent(rent_text: str) -> tuple:
     
     rent_text = rent_text.replace(',', '').replace('$', '').strip()
     
-    # Check if it's per bed pricing
-    if 'bed' in rent_text.lower() or '/bed' in rent_text.lower():
+    # Check if it's per bed pricing (covers "/bed" too)
+    if BED_WORD_RE.search(rent_text):
         price_type = "per_bed"
     else:
         price_type = "total"
     
-    # Extract numbers
-    numbers = re.findall(r'\d+\.?\d*', rent_text)
-    if not numbers:
-        return None, None, price_type
-    
-    numbers = [float(n) for n in numbers]
-    if len(numbers) == 1:
-        return numbers[0], numbers[0], price_type
-    else:
-        return min(numbers), max(numbers), price_type
+    # Extract numbers, keeping a running min/max instead of a list
+    low = high = None
+    for match in RENT_NUMBER_RE.finditer(rent_text):
+        value = float(match.group())
+        if low is None:
+            low = high = value
+        elif value < low:
+            low = value
+        elif value > high:
+            high = value
+    return low, high, price_type
 
 
 def parse_beds_baths(text: str) -> tuple:
     """Parse bedroom/bathroom text."""
     beds, baths = None, None
+    text = text.lower()
     
     # Look for beds
-    bed_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:bed|br|bedroom)', text.lower())
+    bed_match = BEDS_RE.search(text)
     if bed_match:
         beds = float(bed_match.group(1))
-    elif 'studio' in text.lower():
+    elif 'studio' in text:
         beds = 0
     
     # Look for baths
-    bath_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:bath|ba|bathroom)', text.lower())
+    bath_match = BATHS_RE.search(text)
     if bath_match:
         baths = float(bath_match.group(1))
     
@@ -415,7 +454,7 @@ async def scrape_listing(page: Page, url: str) -> Optional[UnitListing]:
                 el = await page.query_selector(sel)
                 if el:
                     text = (await el.text_content()).strip()
-                    sqft_match = re.search(r'(\d+(?:,\d+)?)\s*(?:sq|sqft|sf)', text.lower())
+                    sqft_match = SQFT_RE.search(text)
                     if sqft_match:
                         listing.sqft = int(sqft_match.group(1).replace(',', ''))
                     break
@@ -508,24 +547,32 @@ def geocode_and_filter_units(units: List[UnitListing]) -> List[UnitListing]:
                 by_address[unit.full_address] = []
             by_address[unit.full_address].append(unit)
     
-    # Geocode each unique address
-    for address, address_units in by_address.items():
-        if not address:
-            continue
-        if address_units[0].lat is None or address_units[0].lon is None:
-            logger.info(f"Geocoding: {address}")
-            coords = geocode_address(address)
-            if coords:
-                logger.info(f"  ✓ Found: {coords['lat']:.4f}, {coords['lon']:.4f}")
-                for unit in address_units:
-                    unit.lat = coords['lat']
-                    unit.lon = coords['lon']
+    # Geocode each unique address that still lacks coordinates. Requests overlap on a
+    # small thread pool (one slow response no longer stalls the rest) while the gate
+    # keeps the request rate within Nominatim's limit.
+    to_geocode = [address for address, address_units in by_address.items()
+                  if address_units[0].lat is None or address_units[0].lon is None]
+    if to_geocode:
+        logger.info(f"Geocoding {len(to_geocode)} addresses")
+        with ThreadPoolExecutor(max_workers=min(GEOCODE_WORKERS, len(to_geocode))) as executor:
+            for address, coords in zip(to_geocode, executor.map(cached_geocode, to_geocode)):
+                if coords:
+                    logger.info(f"  ✓ Found {address}: {coords['lat']:.4f}, {coords['lon']:.4f}")
+                    for unit in by_address[address]:
+                        unit.lat = coords['lat']
+                        unit.lon = coords['lon']
     
-    # Filter by distance
+    # Filter by distance (computed for every geocoded unit in one vectorized pass)
+    located = [unit for unit in units if unit.lat is not None and unit.lon is not None]
+    dists = iter(haversine_to_batch(
+        UMN_CAMPUS_ANCHOR,
+        np.fromiter((u.lat for u in located), dtype=float, count=len(located)),
+        np.fromiter((u.lon for u in located), dtype=float, count=len(located)),
+    ).tolist())
     filtered = []
     for unit in units:
         if unit.lat is not None and unit.lon is not None:
-            dist = haversine_distance(unit.lat, unit.lon, UMN_CAMPUS_LAT, UMN_CAMPUS_LON)
+            dist = next(dists)
             unit.dist_to_campus_km = round(dist, 2)
             if dist <= SEARCH_RADIUS_KM:
                 filtered.append(unit)
@@ -561,14 +608,12 @@ def load_existing_listings(csv_path: Path) -> Dict[str, Any]:
 
 def export_to_csv(units: List[UnitListing], filename: Path):
     """Export unit listings to CSV file."""
-    fieldnames = list(UnitListing.__dataclass_fields__.keys())
     logger.info(f"Exporting {len(units)} units to {filename}")
     with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        if units:
-            rows = [asdict(u) for u in units]
-            writer.writerows(rows)
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        # Rows are streamed straight from attributes; asdict would deep-copy every unit
+        writer.writerows(map(unit_row, units))
     logger.info(f"Export complete: {filename}")
 
 
@@ -577,13 +622,12 @@ def merge_and_export(new_units: List[UnitListing], existing: Dict[str, Any], out
     # Convert new units to dict format
     for unit in new_units:
         if unit.listing_id not in existing:
-            existing[unit.listing_id] = asdict(unit)
+            existing[unit.listing_id] = dict(zip(FIELDNAMES, unit_row(unit)))
     
     # Export all
     if existing:
-        fieldnames = list(UnitListing.__dataclass_fields__.keys())
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
             writer.writeheader()
             writer.writerows(existing.values())
         logger.info(f"Merged {len(existing)} total listings to {output_path}")
@@ -600,6 +644,8 @@ async def main(headless: bool = True, max_listings: int = None) -> int:
     Returns:
         Number of units scraped in this session
     """
+    global _CURRENT_SCRAPE_ISO
+    _CURRENT_SCRAPE_ISO = datetime.now().isoformat()
     logger.info("="*80)
     logger.info("UMN LISTINGS SCRAPER STARTED")
     logger.info("="*80)
@@ -668,6 +714,8 @@ async def main(headless: bool = True, max_listings: int = None) -> int:
             });
         """)
 
+        await context.route("**/*", block_heavy_resources)
+
         page = await context.new_page()
 
         try:
@@ -818,6 +866,12 @@ Examples:
 
 if __name__ == "__main__":
     args = parse_args()
+
+    try:
+        import uvloop  # optional; faster event loop for asyncio.run below
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main(
         headless=args.headless,
         max_listings=args.max_listings